@@ -12,14 +12,15 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.data.database import load_csv_to_db
 from src.analysis.breach_analysis import (
-    cost_analysis_by_dimension,
+    precompute_group_aggregates,
     get_top_costliest_incidents,
     detection_response_analysis,
     correlation_analysis,
     generate_executive_summary,
     cost_time_regression,
     attack_vector_analysis,
-    risk_score_calculation
+    risk_score_calculation,
+    pareto_concentration
 )
 from src.visualizations.charts import generate_all_visualizations
 from src.models.risk_prediction import run_all_models
@@ -34,6 +35,17 @@ def print_header(title):
     print("=" * 70)
 
 
+def print_rows(template, rows):
+    """Format every row with one template and write the table in a single call."""
+    sys.stdout.write("".join(template.format(*values) + "\n" for values in rows))
+
+
+def df_rows(df, columns, int_columns=()):
+    """Zip the given DataFrame columns as numpy arrays, casting int_columns to int."""
+    return zip(*(df[col].to_numpy(dtype=int) if col in int_columns else df[col].to_numpy()
+                 for col in columns))
+
+
 def main():
     """Run the complete MissaTech breach analysis pipeline."""
 
@@ -48,8 +60,9 @@ def main():
     print("\nDATA QUALITY SUMMARY")
     print("-" * 50)
     total_rows = len(df)
-    null_counts = df.isnull().sum()
+    null_counts = df.isna().sum()
     has_nulls = null_counts[null_counts > 0]
+    ranges = df[['estimated_total_cost_usd', 'detection_delay_days', 'data_sensitivity_level']].agg(['min', 'max'])
 
     print(f"Total Records Loaded: {total_rows}")
     print(f"Columns: {len(df.columns)}")
@@ -63,13 +76,17 @@ def main():
 
     # Check for anomalies
     print(f"\nData Range Validation:")
-    print(f"  - Cost range: ${df['estimated_total_cost_usd'].min():,.0f} - ${df['estimated_total_cost_usd'].max():,.0f}")
-    print(f"  - Detection delay: {df['detection_delay_days'].min()}-{df['detection_delay_days'].max()} days")
-    print(f"  - Sensitivity levels: {df['data_sensitivity_level'].min()}-{df['data_sensitivity_level'].max()}")
+    cost_min, cost_max = ranges['estimated_total_cost_usd']
+    detection_min, detection_max = ranges['detection_delay_days']
+    sensitivity_min, sensitivity_max = ranges['data_sensitivity_level']
+    print(f"  - Cost range: ${cost_min:,.0f} - ${cost_max:,.0f}")
+    print(f"  - Detection delay: {detection_min}-{detection_max} days")
+    print(f"  - Sensitivity levels: {sensitivity_min}-{sensitivity_max}")
 
     # Step 2: Executive Summary
     print_header("STEP 2: EXECUTIVE SUMMARY")
-    summary = generate_executive_summary()
+    aggregates = precompute_group_aggregates()
+    summary = generate_executive_summary(aggregates)
 
     print(f"""
     DAMAGE ASSESSMENT
@@ -99,62 +116,59 @@ def main():
     # By System
     print("\nA. COST BY SYSTEM")
     print("-" * 70)
-    system_df = cost_analysis_by_dimension('system_name')
+    system_df = aggregates['system_name']
     print(f"{'System':<12} {'Incidents':>10} {'Total Cost':>18} {'Avg Cost':>15} {'Avg Detection':>14}")
     print("-" * 70)
-    for _, row in system_df.iterrows():
-        print(f"{row['system_name']:<12} {int(row['incident_count']):>10} "
-              f"${row['total_cost']:>15,.2f} ${row['avg_cost']:>12,.2f} "
-              f"{row['avg_detection_days']:>10.1f} days")
+    print_rows("{:<12} {:>10} ${:>15,.2f} ${:>12,.2f} {:>10.1f} days",
+               df_rows(system_df, ['system_name', 'incident_count', 'total_cost',
+                                   'avg_cost', 'avg_detection_days'],
+                       int_columns={'incident_count'}))
 
     # By Region (Top 10)
     print("\nB. COST BY REGION (Top 10)")
     print("-" * 70)
-    region_df = cost_analysis_by_dimension('region').head(10)
+    region_df = aggregates['region'].head(10)
     print(f"{'Region':<18} {'Incidents':>10} {'Total Cost':>18} {'Avg Cost':>15}")
     print("-" * 70)
-    for _, row in region_df.iterrows():
-        print(f"{row['region']:<18} {int(row['incident_count']):>10} "
-              f"${row['total_cost']:>15,.2f} ${row['avg_cost']:>12,.2f}")
+    print_rows("{:<18} {:>10} ${:>15,.2f} ${:>12,.2f}",
+               df_rows(region_df, ['region', 'incident_count', 'total_cost', 'avg_cost'],
+                       int_columns={'incident_count'}))
 
     # By Attack Type
     print("\nC. COST BY ATTACK TYPE")
     print("-" * 70)
-    attack_df = cost_analysis_by_dimension('attack_type')
+    attack_df = aggregates['attack_type']
     print(f"{'Attack Type':<22} {'Incidents':>10} {'Total Cost':>18} {'Avg Cost':>15}")
     print("-" * 70)
-    for _, row in attack_df.iterrows():
-        print(f"{row['attack_type']:<22} {int(row['incident_count']):>10} "
-              f"${row['total_cost']:>15,.2f} ${row['avg_cost']:>12,.2f}")
+    print_rows("{:<22} {:>10} ${:>15,.2f} ${:>12,.2f}",
+               df_rows(attack_df, ['attack_type', 'incident_count', 'total_cost', 'avg_cost'],
+                       int_columns={'incident_count'}))
 
     # Step 4: Top 3 Costliest Incidents
     print_header("STEP 4: TOP 3 COSTLIEST INCIDENTS")
     top_incidents = get_top_costliest_incidents(3)
-    for i, row in top_incidents.iterrows():
+    for i, row in enumerate(top_incidents.itertuples(index=False), start=1):
         print(f"""
-    INCIDENT #{i+1}
+    INCIDENT #{i}
     {'-'*50}
-    Total Cost:           ${row['estimated_total_cost_usd']:,.2f}
-    System:               {row['system_name']}
-    Region:               {row['region']}
-    Attack Type:          {row['attack_type']}
-    Data Sensitivity:     Level {row['data_sensitivity_level']}
-    Records Exposed:      {int(row['records_exposed']):,}
-    Cost per Record:      ${row['estimated_cost_per_record_usd']:.2f}
-    Detection Delay:      {int(row['detection_delay_days'])} days
-    Response Time:        {int(row['response_time_days'])} days
-    Notification:         {'Required' if row['notification_required'] else 'Not Required'}
+    Total Cost:           ${row.estimated_total_cost_usd:,.2f}
+    System:               {row.system_name}
+    Region:               {row.region}
+    Attack Type:          {row.attack_type}
+    Data Sensitivity:     Level {row.data_sensitivity_level}
+    Records Exposed:      {int(row.records_exposed):,}
+    Cost per Record:      ${row.estimated_cost_per_record_usd:.2f}
+    Detection Delay:      {int(row.detection_delay_days)} days
+    Response Time:        {int(row.response_time_days)} days
+    Notification:         {'Required' if row.notification_required else 'Not Required'}
     """)
 
     # Step 5: Detection & Response Analysis
     print_header("STEP 5: DETECTION & RESPONSE TIME ANALYSIS")
-    det_resp = detection_response_analysis()
+    det_resp = detection_response_analysis(as_tuples=True)
     print(f"{'System':<12} {'Avg Detection':>15} {'Avg Response':>15} {'Min Detection':>15} {'Max Detection':>15}")
     print("-" * 70)
-    for _, row in det_resp.iterrows():
-        print(f"{row['system_name']:<12} {row['avg_detection']:>11.1f} days "
-              f"{row['avg_response']:>11.1f} days {int(row['min_detection']):>11} days "
-              f"{int(row['max_detection']):>11} days")
+    print_rows("{:<12} {:>11.1f} days {:>11.1f} days {:>11} days {:>11} days", det_resp)
 
     # Step 6: Correlation Analysis
     print_header("STEP 6: CORRELATION ANALYSIS")
@@ -181,25 +195,21 @@ def main():
 
     # Step 8: High Risk System-Region Combinations
     print_header("STEP 8: HIGH-RISK SYSTEM-REGION COMBINATIONS")
-    risk_scores = risk_score_calculation().head(10)
+    risk_scores = risk_score_calculation().nlargest(10, 'risk_score')
     print(f"{'System':<12} {'Region':<18} {'Risk Score':>12} {'Total Cost':>15} {'Incidents':>10}")
     print("-" * 70)
-    for _, row in risk_scores.iterrows():
-        print(f"{row['system_name']:<12} {row['region']:<18} {row['risk_score']:>8.1f}/100 "
-              f"${row['total_cost']:>12,.2f} {int(row['incident_frequency']):>10}")
+    print_rows("{:<12} {:<18} {:>8.1f}/100 ${:>12,.2f} {:>10}",
+               df_rows(risk_scores, ['system_name', 'region', 'risk_score',
+                                     'total_cost', 'incident_frequency'],
+                       int_columns={'incident_frequency'}))
 
     # Step 8b: Pareto Analysis Summary
     print("\nPARETO ANALYSIS (80/20 RULE)")
     print("-" * 50)
-    from src.data.database import get_all_incidents
-    pareto_df = get_all_incidents().sort_values('estimated_total_cost_usd', ascending=False).reset_index(drop=True)
-    pareto_df['cumulative_cost'] = pareto_df['estimated_total_cost_usd'].cumsum()
-    pareto_df['cumulative_pct'] = pareto_df['cumulative_cost'] / pareto_df['estimated_total_cost_usd'].sum() * 100
-    idx_80 = pareto_df[pareto_df['cumulative_pct'] >= 80].index[0]
-    pct_incidents = (idx_80 + 1) / len(pareto_df) * 100
-
-    print(f"Critical Insight: {pct_incidents:.0f}% of incidents cause 80% of costs")
-    print(f"Top {idx_80+1} incidents = ${pareto_df['cumulative_cost'].iloc[idx_80]/1e6:.1f}M")
+    pareto = pareto_concentration()
+
+    print(f"Critical Insight: {pareto['pct_incidents']:.0f}% of incidents cause 80% of costs")
+    print(f"Top {pareto['incident_count']} incidents = ${pareto['cumulative_cost']/1e6:.1f}M")
     print("Focus remediation on the highest-cost system-region combinations")
 
     # Step 9: Generate Visualizations
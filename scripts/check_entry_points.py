@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Smoke check: run main.py, then every module's own command line.
+
+The modules are imported under different names depending on the entry
+point (src.analysis..., analysis..., __main__), so each one is run after
+main.py has warmed any caches to make sure none of them breaks the other.
+The dashboard needs a display; only its data loading is exercised.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Each step: description, command line, text fed to stdin
+STEPS = [
+    ("main pipeline", [sys.executable, "main.py"], "4\n"),
+    ("database module", [sys.executable, "src/data/database.py"], None),
+    ("analysis module", [sys.executable, "src/analysis/breach_analysis.py"], None),
+    ("charts module (forced)", [sys.executable, "-c",
+        "import sys; sys.path.insert(0, 'src/visualizations'); "
+        "import charts; charts.generate_all_visualizations(force=True)"], None),
+    ("models module", [sys.executable, "src/models/risk_prediction.py"], None),
+    ("presentation module", [sys.executable, "src/presentation/leadership_slides.py"], None),
+    ("dashboard data", [sys.executable, "-c",
+        "import sys; sys.path.insert(0, 'src/dashboard'); "
+        "from monitoring_dashboard import MissaTechDashboard; "
+        "from src.data.database import get_all_incidents; "
+        "MissaTechDashboard._compute_all(get_all_incidents())"], None),
+]
+
+# Kernels called from inside src/, where the src package itself is not importable
+MODULE_CALLS = [
+    ("risk scores", "src/analysis", "import breach_analysis; breach_analysis.risk_score_calculation()"),
+    ("pareto concentration", "src/analysis", "import breach_analysis; breach_analysis.pareto_concentration()"),
+]
+
+
+def main():
+    failed = []
+    steps = [(name, ROOT, cmd, stdin) for name, cmd, stdin in STEPS]
+    steps += [(name, ROOT / cwd, [sys.executable, "-c", code], None)
+              for name, cwd, code in MODULE_CALLS]
+    for name, cwd, cmd, stdin in steps:
+        result = subprocess.run(cmd, cwd=cwd, input=stdin, capture_output=True, text=True,
+                                env={**os.environ, 'MPLBACKEND': 'Agg'})
+        print(f"{'ok' if result.returncode == 0 else 'FAILED':6} {name}")
+        if result.returncode != 0:
+            failed.append(name)
+            print(result.stderr[-2000:])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,45 +2,144 @@
 Core analysis functions for MissaTech breach data.
 """
 
+import os
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from data.database import query, get_all_incidents
-
-
-def cost_analysis_by_dimension(dimension):
-    """Calculate total and average cost by a specific dimension."""
-    sql = f"""
-    SELECT
-        {dimension},
-        COUNT(*) as incident_count,
-        SUM(estimated_total_cost_usd) as total_cost,
-        AVG(estimated_total_cost_usd) as avg_cost,
-        SUM(records_exposed) as total_records,
-        AVG(detection_delay_days) as avg_detection_days,
-        AVG(response_time_days) as avg_response_days
-    FROM breach_incidents
-    GROUP BY {dimension}
-    ORDER BY total_cost DESC
+from data.database import query, query_tuples, get_all_incidents
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional; the pandas paths are always available
+    pl = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels fall back to numpy
+    njit = None
+
+# Set MISSATECH_USE_POLARS=1 to run the heavier aggregations on Polars
+USE_POLARS = pl is not None and os.environ.get('MISSATECH_USE_POLARS') == '1'
+
+# Dimensions shown in the cost breakdowns and the executive summary
+COST_DIMENSIONS = ('system_name', 'region', 'attack_type')
+
+# Columns and weights feeding the composite risk score
+RISK_FACTORS = ['incident_frequency', 'total_cost', 'avg_sensitivity', 'avg_detection', 'total_records']
+RISK_WEIGHTS = np.array([0.2, 0.3, 0.2, 0.15, 0.15])
+
+# Incident columns aggregated by risk_score_calculation
+RISK_SOURCE_COLUMNS = (
+    'system_name', 'region', 'estimated_total_cost_usd', 'data_sensitivity_level',
+    'detection_delay_days', 'records_exposed'
+)
+
+# Incident details shown for the costliest incidents
+TOP_INCIDENT_COLUMNS = (
+    'system_name', 'region', 'attack_type', 'data_sensitivity_level',
+    'records_exposed', 'estimated_cost_per_record_usd', 'estimated_total_cost_usd',
+    'detection_delay_days', 'response_time_days', 'notification_required'
+)
+
+# Columns of detection_response_analysis, in order
+DETECTION_STATS_COLUMNS = (
+    'system_name', 'avg_detection', 'avg_response', 'min_detection', 'max_detection', 'incidents'
+)
+
+# Detection extremes added to the system cost breakdown by system_breakdowns
+DETECTION_EXTREMES = {
+    'min_detection': ('detection_delay_days', 'min'),
+    'max_detection': ('detection_delay_days', 'max')
+}
+
+# Variable pairs reported by correlation_analysis
+CORRELATION_PAIRS = {
+    'detection_vs_cost': ('detection_delay_days', 'estimated_total_cost_usd'),
+    'response_vs_cost': ('response_time_days', 'estimated_total_cost_usd'),
+    'records_vs_cost': ('records_exposed', 'estimated_total_cost_usd'),
+    'sensitivity_vs_cost': ('data_sensitivity_level', 'estimated_total_cost_usd'),
+    'detection_vs_records': ('detection_delay_days', 'records_exposed')
+}
+
+
+def cost_analysis_by_dimension(dimension, df=None, extra_aggs=None):
+    """Calculate total and average cost by a specific dimension.
+
+    extra_aggs maps further output columns to (column, function) pairs,
+    e.g. {'max_detection': ('detection_delay_days', 'max')}; they follow
+    the standard columns.
     """
-    return query(sql)
+    if df is None:
+        df = get_all_incidents()
+    extra_aggs = extra_aggs or {}
+    if USE_POLARS:
+        return _cost_analysis_polars(df, dimension, extra_aggs)
+
+    return df.groupby(dimension, observed=True).agg(
+        incident_count=('estimated_total_cost_usd', 'count'),
+        total_cost=('estimated_total_cost_usd', 'sum'),
+        avg_cost=('estimated_total_cost_usd', 'mean'),
+        total_records=('records_exposed', 'sum'),
+        avg_detection_days=('detection_delay_days', 'mean'),
+        avg_response_days=('response_time_days', 'mean'),
+        **extra_aggs
+    ).astype({'total_records': 'int64'}).sort_values('total_cost', ascending=False).reset_index()
+
+
+def _cost_analysis_polars(df, dimension, extra_aggs):
+    """Polars version of cost_analysis_by_dimension."""
+    cost = pl.col('estimated_total_cost_usd')
+    return pl.from_pandas(df).group_by(dimension).agg(
+        pl.len().alias('incident_count'),
+        cost.sum().alias('total_cost'),
+        cost.mean().alias('avg_cost'),
+        pl.col('records_exposed').cast(pl.Int64).sum().alias('total_records'),
+        pl.col('detection_delay_days').mean().alias('avg_detection_days'),
+        pl.col('response_time_days').mean().alias('avg_response_days'),
+        *(getattr(pl.col(col), func)().alias(name) for name, (col, func) in extra_aggs.items())
+    ).sort('total_cost', descending=True).to_pandas()
+
+
+def precompute_group_aggregates(df=None):
+    """Compute cost_analysis_by_dimension for every COST_DIMENSIONS entry in one go."""
+    if df is None:
+        df = get_all_incidents()
+
+    return {dim: cost_analysis_by_dimension(dim, df) for dim in COST_DIMENSIONS}
 
 
 def get_top_costliest_incidents(n=3):
-    """Get the top N costliest incidents with full details."""
-    sql = f"""
-    SELECT *
-    FROM breach_incidents
-    ORDER BY estimated_total_cost_usd DESC
-    LIMIT {n}
+    """Get the top N costliest incidents with the details shown in the report."""
+    # Partial sort of the cached frame instead of a full ORDER BY in SQLite
+    df = get_all_incidents(columns=TOP_INCIDENT_COLUMNS)
+    return df.nlargest(n, 'estimated_total_cost_usd').reset_index(drop=True)
+
+
+def system_breakdowns(df=None):
+    """System cost breakdown and detection stats from a single groupby.
+
+    Returns (costs, detection): the same frames as
+    cost_analysis_by_dimension('system_name', df) and
+    detection_response_analysis().
     """
-    return query(sql)
+    by_system = cost_analysis_by_dimension('system_name', df, DETECTION_EXTREMES)
+    costs = by_system.drop(columns=list(DETECTION_EXTREMES))
+    detection = by_system.rename(columns={
+        'avg_detection_days': 'avg_detection',
+        'avg_response_days': 'avg_response',
+        'incident_count': 'incidents'
+    })[list(DETECTION_STATS_COLUMNS)].sort_values('avg_detection', ascending=False, ignore_index=True)
+    return costs, detection
+
 
+def detection_response_analysis(as_tuples=False):
+    """Analyze detection and response times across systems.
 
-def detection_response_analysis():
-    """Analyze detection and response times across systems."""
+    With as_tuples=True the rows come back as namedtuples instead of a
+    DataFrame, which is all the console report needs.
+    """
     sql = """
     SELECT
         system_name,
@@ -53,58 +152,148 @@ def detection_response_analysis():
     GROUP BY system_name
     ORDER BY avg_detection DESC
     """
-    return query(sql)
+    return query_tuples(sql) if as_tuples else query(sql)
 
 
-def correlation_analysis():
+def correlation_analysis(df=None):
     """Analyze correlations between variables."""
-    df = get_all_incidents()
+    if df is None:
+        df = get_all_incidents()
+    if USE_POLARS:
+        row = pl.from_pandas(df).select(
+            pl.corr(a, b).alias(key) for key, (a, b) in CORRELATION_PAIRS.items()
+        )
+        return row.row(0, named=True)
+
+    cols = ['detection_delay_days', 'response_time_days', 'records_exposed',
+            'data_sensitivity_level', 'estimated_total_cost_usd']
+    m = correlation_matrix(df, cols)
 
     correlations = {
-        'detection_vs_cost': df['detection_delay_days'].corr(df['estimated_total_cost_usd']),
-        'response_vs_cost': df['response_time_days'].corr(df['estimated_total_cost_usd']),
-        'records_vs_cost': df['records_exposed'].corr(df['estimated_total_cost_usd']),
-        'sensitivity_vs_cost': df['data_sensitivity_level'].corr(df['estimated_total_cost_usd']),
-        'detection_vs_records': df['detection_delay_days'].corr(df['records_exposed'])
+        key: m.at[a, b] for key, (a, b) in CORRELATION_PAIRS.items()
     }
 
     return correlations
 
 
-def risk_score_calculation():
-    """Calculate risk scores for each system-region combination."""
-    sql = """
-    SELECT
-        system_name,
-        region,
-        COUNT(*) as incident_frequency,
-        SUM(estimated_total_cost_usd) as total_cost,
-        AVG(data_sensitivity_level) as avg_sensitivity,
-        AVG(detection_delay_days) as avg_detection,
-        SUM(records_exposed) as total_records
-    FROM breach_incidents
-    GROUP BY system_name, region
-    """
-    df = query(sql)
-
-    # Normalize each factor to 0-1 scale (handle division by zero)
-    for col in ['incident_frequency', 'total_cost', 'avg_sensitivity', 'avg_detection', 'total_records']:
-        col_range = df[col].max() - df[col].min()
-        if col_range == 0:
-            df[f'{col}_norm'] = 0.5  # Default to mid-range if all values are the same
-        else:
-            df[f'{col}_norm'] = (df[col] - df[col].min()) / col_range
-
-    # Calculate composite risk score
-    df['risk_score'] = (
-        df['incident_frequency_norm'] * 0.2 +
-        df['total_cost_norm'] * 0.3 +
-        df['avg_sensitivity_norm'] * 0.2 +
-        df['avg_detection_norm'] * 0.15 +
-        df['total_records_norm'] * 0.15
-    ) * 100
+def correlation_matrix(df, columns):
+    """Pearson correlation matrix of the given columns.
 
-    return df.sort_values('risk_score', ascending=False)
+    Like DataFrame.corr, each pair is correlated over the rows where both
+    values are present.
+    """
+    arr = df[list(columns)].to_numpy(dtype=np.float64)
+    if np.isnan(arr).any():
+        # Pairwise-complete rows differ per pair; leave those to pandas
+        return pd.DataFrame(arr, columns=columns).corr()
+    return pd.DataFrame(_pearson(arr), index=columns, columns=columns)
+
+
+def _pearson_numpy(arr):
+    """Correlation matrix of the columns of arr."""
+    return np.corrcoef(arr, rowvar=False)
+
+
+# Compiled per process: numba's disk cache records the importing module's
+# name, which differs between main.py and the module command lines. Without
+# fastmath a constant column gives NaN, as np.corrcoef does
+if njit is not None:
+    @njit
+    def _pearson(arr):
+        """Compiled equivalent of _pearson_numpy."""
+        n_rows, n_cols = arr.shape
+        z = np.empty((n_rows, n_cols))
+        for j in range(n_cols):
+            centered = arr[:, j] - arr[:, j].mean()
+            z[:, j] = centered / np.sqrt((centered * centered).sum())
+        return z.T @ z
+else:
+    _pearson = _pearson_numpy
+
+
+def risk_score_calculation(df=None):
+    """Calculate risk scores for each system-region combination.
+
+    Rows are not ordered; use nlargest(n, 'risk_score') for the top n.
+    """
+    incidents = get_all_incidents(columns=RISK_SOURCE_COLUMNS) if df is None else df
+    if USE_POLARS:
+        return _risk_score_polars(incidents)
+
+    # Group the cached incidents rather than running another GROUP BY in SQLite
+    df = incidents.groupby(['system_name', 'region'], observed=True).agg(
+        incident_frequency=('estimated_total_cost_usd', 'size'),
+        total_cost=('estimated_total_cost_usd', 'sum'),
+        avg_sensitivity=('data_sensitivity_level', 'mean'),
+        avg_detection=('detection_delay_days', 'mean'),
+        total_records=('records_exposed', 'sum')
+    ).astype({'total_records': 'int64'}).reset_index()
+
+    # Normalize each factor to 0-1 scale and take the weighted composite score
+    norm, scores = _risk_kernel(df[RISK_FACTORS].to_numpy(dtype=np.float64), RISK_WEIGHTS)
+    df[[f'{col}_norm' for col in RISK_FACTORS]] = norm
+    df['risk_score'] = scores
+
+    return df
+
+
+def _risk_kernel_numpy(arr, weights):
+    """Min-max normalize each column of arr and return (norm, weighted score * 100)."""
+    col_min = arr.min(axis=0)
+    col_range = np.ptp(arr, axis=0)
+    flat = col_range == 0
+    norm = (arr - col_min) / np.where(flat, 1.0, col_range)
+    norm[:, flat] = 0.5  # Default to mid-range if all values are the same
+    return norm, norm @ weights * 100
+
+
+if njit is not None:
+    @njit(fastmath=True)  # no disk cache, for the reason given at _pearson
+    def _risk_kernel(arr, weights):
+        """Compiled equivalent of _risk_kernel_numpy."""
+        n_rows, n_cols = arr.shape
+        col_min = np.empty(n_cols)
+        col_range = np.empty(n_cols)
+        for j in range(n_cols):
+            col_min[j] = arr[:, j].min()
+            col_range[j] = arr[:, j].max() - col_min[j]
+
+        norm = np.empty((n_rows, n_cols))
+        scores = np.empty(n_rows)
+        for i in range(n_rows):
+            total = 0.0
+            for j in range(n_cols):
+                if col_range[j] == 0:
+                    norm[i, j] = 0.5
+                else:
+                    norm[i, j] = (arr[i, j] - col_min[j]) / col_range[j]
+                total += norm[i, j] * weights[j]
+            scores[i] = total * 100
+        return norm, scores
+else:
+    _risk_kernel = _risk_kernel_numpy
+
+
+def _risk_score_polars(df):
+    """Polars version of risk_score_calculation."""
+    grouped = pl.from_pandas(df).group_by(['system_name', 'region']).agg(
+        pl.len().alias('incident_frequency'),
+        pl.col('estimated_total_cost_usd').sum().alias('total_cost'),
+        pl.col('data_sensitivity_level').mean().alias('avg_sensitivity'),
+        pl.col('detection_delay_days').mean().alias('avg_detection'),
+        pl.col('records_exposed').cast(pl.Int64).sum().alias('total_records')
+    )
+
+    def normalized(col):
+        c = pl.col(col)
+        col_range = c.max() - c.min()
+        return (pl.when(col_range == 0).then(0.5)
+                .otherwise((c - c.min()) / col_range)
+                .alias(f'{col}_norm'))
+
+    scored = grouped.with_columns(normalized(col) for col in RISK_FACTORS)
+    risk = sum(pl.col(f'{col}_norm') * w for col, w in zip(RISK_FACTORS, RISK_WEIGHTS))
+    return scored.with_columns((risk * 100).alias('risk_score')).to_pandas()
 
 
 def attack_vector_analysis():
@@ -141,13 +330,15 @@ def sensitivity_impact_analysis():
     return query(sql)
 
 
-def cost_time_regression():
+def cost_time_regression(df=None):
     """Estimate cost savings from faster detection/response."""
-    df = get_all_incidents()
+    if df is None:
+        df = get_all_incidents()
 
     # Calculate average cost per day of detection delay
-    cost_per_detection_day = df['estimated_total_cost_usd'].sum() / df['detection_delay_days'].sum()
-    cost_per_response_day = df['estimated_total_cost_usd'].sum() / df['response_time_days'].sum()
+    total_cost = df['estimated_total_cost_usd'].to_numpy().sum()
+    cost_per_detection_day = total_cost / df['detection_delay_days'].to_numpy().sum()
+    cost_per_response_day = total_cost / df['response_time_days'].to_numpy().sum()
 
     # Estimate savings from 1-day improvement
     total_incidents = len(df)
@@ -162,9 +353,75 @@ def cost_time_regression():
     }
 
 
-def generate_executive_summary():
-    """Generate a complete executive summary of the breach analysis."""
-    df = get_all_incidents()
+def pareto_concentration(df=None, threshold=0.80):
+    """Find how few of the costliest incidents make up `threshold` of total cost."""
+    if df is None:
+        df = get_all_incidents()
+
+    if USE_POLARS:
+        cumulative_cost = (pl.from_pandas(df)
+                           .select(pl.col('estimated_total_cost_usd')
+                                   .sort(descending=True).cum_sum())
+                           .to_series().to_numpy())
+        idx = int(np.argmax(cumulative_cost >= threshold * cumulative_cost[-1]))
+    else:
+        costs = np.sort(df['estimated_total_cost_usd'].to_numpy(dtype=np.float64))[::-1]
+        cumulative_cost, idx = pareto_curve(costs, threshold)
+
+    return {
+        'incident_count': idx + 1,
+        'pct_incidents': (idx + 1) / len(cumulative_cost) * 100,
+        'cumulative_cost': cumulative_cost[idx]
+    }
+
+
+def pareto_curve(costs_desc, threshold=0.80):
+    """Running total of costs sorted descending, and where it first reaches threshold.
+
+    Returns (cumulative, idx) with cumulative[idx] >= threshold * total.
+    """
+    return _pareto_kernel(np.ascontiguousarray(costs_desc, dtype=np.float64), threshold)
+
+
+def _pareto_kernel_numpy(costs_desc, threshold):
+    """Cumulative sum of costs_desc and the first index reaching threshold of the total."""
+    cumulative = np.cumsum(costs_desc)
+    return cumulative, int(np.searchsorted(cumulative, threshold * cumulative[-1]))
+
+
+if njit is not None:
+    @njit  # no disk cache, for the reason given at _pearson
+    def _pareto_kernel(costs_desc, threshold):
+        """Compiled equivalent of _pareto_kernel_numpy."""
+        n = costs_desc.size
+        cumulative = np.empty(n)
+        total = 0.0
+        for i in range(n):
+            total += costs_desc[i]
+            cumulative[i] = total
+
+        target = threshold * total
+        for i in range(n):
+            if cumulative[i] >= target:
+                return cumulative, i
+        return cumulative, n - 1
+else:
+    _pareto_kernel = _pareto_kernel_numpy
+
+
+def generate_executive_summary(aggregates=None, df=None):
+    """Generate a complete executive summary of the breach analysis.
+
+    Pass the result of precompute_group_aggregates() to reuse breakdowns
+    the caller has already computed.
+    """
+    if df is None:
+        df = get_all_incidents()
+    if aggregates is None:
+        aggregates = precompute_group_aggregates(df)
+
+    # Breakdowns are sorted by total cost, so the first row is the top one
+    top_by_cost = {dim: aggregates[dim][dim].iloc[0] for dim in COST_DIMENSIONS}
 
     summary = {
         'total_incidents': len(df),
@@ -173,9 +430,9 @@ def generate_executive_summary():
         'avg_cost_per_incident': df['estimated_total_cost_usd'].mean(),
         'avg_detection_days': df['detection_delay_days'].mean(),
         'avg_response_days': df['response_time_days'].mean(),
-        'most_costly_system': cost_analysis_by_dimension('system_name').iloc[0]['system_name'],
-        'most_costly_region': cost_analysis_by_dimension('region').iloc[0]['region'],
-        'most_common_attack': cost_analysis_by_dimension('attack_type').iloc[0]['attack_type'],
+        'most_costly_system': top_by_cost['system_name'],
+        'most_costly_region': top_by_cost['region'],
+        'most_common_attack': top_by_cost['attack_type'],
         'highest_sensitivity_incidents': len(df[df['data_sensitivity_level'] >= 4]),
         'notifications_required': df['notification_required'].sum()
     }
@@ -10,18 +10,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import pandas as pd
-from PIL import Image, ImageTk
+import numpy as np
 
 from src.data.database import get_all_incidents
 from src.analysis.breach_analysis import (
     generate_executive_summary,
     cost_analysis_by_dimension,
     risk_score_calculation,
-    detection_response_analysis
+    system_breakdowns
 )
 
 
@@ -74,13 +70,36 @@ class MissaTechDashboard:
         """Load fresh data from database."""
         try:
             self.df = get_all_incidents()
-            self.summary = generate_executive_summary()
-            self.system_costs = cost_analysis_by_dimension('system_name')
-            self.risk_scores = risk_score_calculation().head(5)
-            self.detection_stats = detection_response_analysis()
+            # Every widget works from the one incidents frame loaded above
+            data = self._compute_all(self.df)
+            self.summary = data['summary']
+            self.system_costs = data['system_costs']
+            self.risk_scores = data['risk_scores']
+            self.detection_stats = data['detection_stats']
         except Exception as e:
             messagebox.showerror("Data Error", f"Failed to load data: {str(e)}")
 
+    @staticmethod
+    def _compute_all(df):
+        """Compute the summary, system costs, risk scores and detection stats.
+
+        System costs and detection stats share a single groupby over df
+        instead of a pandas breakdown plus a separate SQL query.
+        """
+        system_costs, detection_stats = system_breakdowns(df)
+
+        aggregates = {
+            'system_name': system_costs,
+            'region': cost_analysis_by_dimension('region', df),
+            'attack_type': cost_analysis_by_dimension('attack_type', df)
+        }
+        return {
+            'summary': generate_executive_summary(aggregates, df),
+            'system_costs': system_costs,
+            'risk_scores': risk_score_calculation(df).nlargest(5, 'risk_score'),
+            'detection_stats': detection_stats
+        }
+
     def create_layout(self):
         """Create the main dashboard layout."""
         # Main container
@@ -126,9 +145,9 @@ class MissaTechDashboard:
         self.create_risk_table(right_frame)
         self.create_alerts_panel(right_frame)
 
-    def create_kpi_cards(self, parent):
-        """Create KPI metric cards."""
-        kpis = [
+    def kpi_items(self):
+        """KPI card titles, formatted values and accent colors."""
+        return [
             ("Total Cost", f"${self.summary['total_cost']/1e6:.1f}M", "#fc8181"),
             ("Avg Detection", f"{self.summary['avg_detection_days']:.1f} days", "#f6ad55"),
             ("Avg Response", f"{self.summary['avg_response_days']:.1f} days", "#68d391"),
@@ -136,7 +155,10 @@ class MissaTechDashboard:
             ("High Sensitivity", f"{self.summary['highest_sensitivity_incidents']}", "#b794f4"),
         ]
 
-        for i, (title, value, color) in enumerate(kpis):
+    def create_kpi_cards(self, parent):
+        """Create KPI metric cards."""
+        self.kpi_labels = []
+        for i, (title, value, color) in enumerate(self.kpi_items()):
             card = tk.Frame(parent, bg='#2d3748', relief=tk.FLAT)
             card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=3)
 
@@ -150,11 +172,44 @@ class MissaTechDashboard:
 
             tk.Label(content, text=title, bg='#2d3748', fg='#a0aec0',
                     font=('Segoe UI', 9)).pack(anchor=tk.W)
-            tk.Label(content, text=value, bg='#2d3748', fg='#ffffff',
-                    font=('Segoe UI', 20, 'bold')).pack(anchor=tk.W)
+            value_label = tk.Label(content, text=value, bg='#2d3748', fg='#ffffff',
+                                   font=('Segoe UI', 20, 'bold'))
+            value_label.pack(anchor=tk.W)
+            self.kpi_labels.append(value_label)
+
+    def register_blit_chart(self, canvas, ax, artists):
+        """Track a chart whose data artists are redrawn by blitting.
+
+        The artists must be animated. Every full draw caches the static
+        background of the axes and then paints the artists over it.
+        """
+        chart = {'canvas': canvas, 'ax': ax, 'artists': list(artists), 'background': None}
+
+        def on_draw(event):
+            chart['background'] = canvas.copy_from_bbox(ax.bbox)
+            for artist in chart['artists']:
+                ax.draw_artist(artist)
+
+        canvas.mpl_connect('draw_event', on_draw)
+        return chart
+
+    def blit_chart(self, chart):
+        """Repaint only the chart's data artists over its cached background."""
+        canvas, ax = chart['canvas'], chart['ax']
+        if chart['background'] is None:
+            canvas.draw()
+            return
+        canvas.restore_region(chart['background'])
+        for artist in chart['artists']:
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
 
     def create_system_chart(self, parent):
         """Create system cost chart."""
+        # matplotlib is imported on first layout, not at dashboard import
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
         card = tk.Frame(parent, bg='#2d3748')
         card.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
 
@@ -162,26 +217,63 @@ class MissaTechDashboard:
                 font=('Segoe UI', 12, 'bold')).pack(anchor=tk.W, padx=10, pady=5)
 
         fig = Figure(figsize=(6, 3), facecolor='#2d3748')
+        # Fixed margins, so refreshes never need a layout pass
+        fig.subplots_adjust(left=0.16, right=0.97, top=0.95, bottom=0.17)
         ax = fig.add_subplot(111)
 
-        systems = self.system_costs['system_name'].tolist()
-        costs = (self.system_costs['total_cost'] / 1e6).tolist()
-        colors = ['#fc8181', '#f6ad55', '#68d391', '#63b3ed', '#b794f4']
-
-        bars = ax.barh(systems, costs, color=colors)
         ax.set_xlabel('Cost (Millions USD)', color='#a0aec0')
         ax.set_facecolor('#2d3748')
         ax.tick_params(colors='#a0aec0')
         for spine in ax.spines.values():
             spine.set_color('#4a5568')
 
-        fig.tight_layout()
         canvas = FigureCanvasTkAgg(fig, master=card)
+        self.system_chart = self.register_blit_chart(canvas, ax, [])
+        self.system_bars = None
+        self.draw_system_bars()
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+    def draw_system_bars(self):
+        """(Re)create the system cost bars from self.system_costs."""
+        ax = self.system_chart['ax']
+        # Removing the container also drops it from ax.containers
+        if self.system_bars is not None:
+            self.system_bars.remove()
+
+        systems = self.system_costs['system_name'].tolist()
+        costs = self.system_costs['total_cost'].to_numpy() / 1e6
+        colors = ['#fc8181', '#f6ad55', '#68d391', '#63b3ed', '#b794f4']
+
+        y = range(len(systems))
+        bars = ax.barh(y, costs, color=colors, animated=True)
+        ax.set_yticks(y, systems)
+        ax.relim()
+        ax.autoscale_view()
+        self.system_chart['artists'] = list(bars)
+        self.system_bars = bars
+        self.system_labels = systems
+
+    def update_system_chart(self):
+        """Update the system cost bars in place, blitting when the axes are unchanged."""
+        systems = self.system_costs['system_name'].tolist()
+        costs = self.system_costs['total_cost'].to_numpy() / 1e6
+        ax = self.system_chart['ax']
+
+        if systems != self.system_labels or costs.max() > ax.get_xlim()[1]:
+            self.draw_system_bars()
+            self.system_chart['canvas'].draw_idle()
+            return
+
+        for bar, cost in zip(self.system_bars, costs):
+            bar.set_width(cost)
+        self.blit_chart(self.system_chart)
+
     def create_detection_chart(self, parent):
         """Create detection/response time chart."""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
         card = tk.Frame(parent, bg='#2d3748')
         card.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
 
@@ -189,35 +281,74 @@ class MissaTechDashboard:
                 font=('Segoe UI', 12, 'bold')).pack(anchor=tk.W, padx=10, pady=5)
 
         fig = Figure(figsize=(6, 3), facecolor='#2d3748')
+        # Fixed margins, so refreshes never need a layout pass
+        fig.subplots_adjust(left=0.1, right=0.97, top=0.95, bottom=0.12)
         ax = fig.add_subplot(111)
 
-        systems = self.detection_stats['system_name'].tolist()
-        x = range(len(systems))
-        width = 0.35
-
-        detection = self.detection_stats['avg_detection'].tolist()
-        response = self.detection_stats['avg_response'].tolist()
-
-        ax.bar([i - width/2 for i in x], detection, width, label='Detection', color='#f6ad55')
-        ax.bar([i + width/2 for i in x], response, width, label='Response', color='#68d391')
-
         ax.set_ylabel('Days', color='#a0aec0')
-        ax.set_xticks(x)
-        ax.set_xticklabels(systems)
-        ax.legend(facecolor='#2d3748', edgecolor='#4a5568', labelcolor='#ffffff')
         ax.set_facecolor('#2d3748')
         ax.tick_params(colors='#a0aec0')
         for spine in ax.spines.values():
             spine.set_color('#4a5568')
 
-        # Target line
-        ax.axhline(y=3, color='#fc8181', linestyle='--', linewidth=1, label='Target')
+        # Target line; animated too so it stays drawn on top of the bars
+        self.detection_target = ax.axhline(y=3, color='#fc8181', linestyle='--',
+                                           linewidth=1, label='Target', animated=True)
 
-        fig.tight_layout()
         canvas = FigureCanvasTkAgg(fig, master=card)
+        self.detection_chart = self.register_blit_chart(canvas, ax, [])
+        self.detection_bars = ()
+        self.draw_detection_bars()
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+    def draw_detection_bars(self):
+        """(Re)create the detection/response bars from self.detection_stats."""
+        ax = self.detection_chart['ax']
+        for container in self.detection_bars:
+            container.remove()
+
+        systems = self.detection_stats['system_name'].tolist()
+        x = np.arange(len(systems))
+        width = 0.35
+
+        detection = self.detection_stats['avg_detection'].to_numpy()
+        response = self.detection_stats['avg_response'].to_numpy()
+
+        det_bars = ax.bar(x - width/2, detection, width, label='Detection',
+                          color='#f6ad55', animated=True)
+        resp_bars = ax.bar(x + width/2, response, width, label='Response',
+                           color='#68d391', animated=True)
+
+        ax.set_xticks(x, systems)
+        ax.relim()
+        ax.autoscale_view()
+        ax.legend(handles=[det_bars, resp_bars], facecolor='#2d3748',
+                  edgecolor='#4a5568', labelcolor='#ffffff')
+        self.detection_chart['artists'] = [*det_bars, *resp_bars, self.detection_target]
+        self.detection_bars = (det_bars, resp_bars)
+        self.detection_labels = systems
+
+    def update_detection_chart(self):
+        """Update the detection/response bars in place, blitting when possible."""
+        systems = self.detection_stats['system_name'].tolist()
+        detection = self.detection_stats['avg_detection'].to_numpy()
+        response = self.detection_stats['avg_response'].to_numpy()
+        ax = self.detection_chart['ax']
+
+        if (systems != self.detection_labels
+                or max(detection.max(), response.max()) > ax.get_ylim()[1]):
+            self.draw_detection_bars()
+            self.detection_chart['canvas'].draw_idle()
+            return
+
+        det_bars, resp_bars = self.detection_bars
+        for bar, value in zip(det_bars, detection):
+            bar.set_height(value)
+        for bar, value in zip(resp_bars, response):
+            bar.set_height(value)
+        self.blit_chart(self.detection_chart)
+
     def create_risk_table(self, parent):
         """Create high-risk combinations table."""
         card = tk.Frame(parent, bg='#2d3748')
@@ -235,16 +366,24 @@ class MissaTechDashboard:
             tree.heading(col, text=col)
             tree.column(col, width=100)
 
-        for _, row in self.risk_scores.iterrows():
-            tree.insert('', tk.END, values=(
-                row['system_name'],
-                row['region'],
-                f"{row['risk_score']:.1f}/100",
-                f"${row['total_cost']/1e6:.2f}M"
-            ))
+        self.risk_tree = tree
+        self.fill_risk_table()
 
         tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+    def fill_risk_table(self):
+        """Replace the risk table rows with the current risk scores."""
+        tree = self.risk_tree
+        tree.delete(*tree.get_children())
+        rows = self.risk_scores[['system_name', 'region', 'risk_score', 'total_cost']].to_numpy()
+        for system, region, risk_score, total_cost in rows:
+            tree.insert('', tk.END, values=(
+                system,
+                region,
+                f"{risk_score:.1f}/100",
+                f"${total_cost/1e6:.2f}M"
+            ))
+
     def create_alerts_panel(self, parent):
         """Create alerts and recommendations panel."""
         card = tk.Frame(parent, bg='#2d3748')
@@ -277,10 +416,12 @@ class MissaTechDashboard:
     def on_refresh(self):
         """Refresh all dashboard data."""
         self.refresh_data()
-        # Clear and rebuild
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.create_layout()
+        # Update the existing widgets in place instead of rebuilding the window
+        for label, (_, value, _) in zip(self.kpi_labels, self.kpi_items()):
+            label.config(text=value)
+        self.update_system_chart()
+        self.update_detection_chart()
+        self.fill_risk_table()
         messagebox.showinfo("Refresh", "Dashboard data refreshed successfully!")
 
 
@@ -2,43 +2,139 @@
 Database module for loading and managing the MissaTech breach data.
 """
 
+import atexit
+import hashlib
+import os
 import sqlite3
+from collections import namedtuple
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "missatech_breach.db"
 CSV_PATH = Path(__file__).parent.parent.parent / "databreach.csv"
 
+# Incidents table cached per database file version (see get_all_incidents)
+_incidents_cache = {}
+
+INCIDENT_COLUMNS = [
+    'system_name', 'region', 'attack_type', 'data_sensitivity_level',
+    'records_exposed', 'estimated_cost_per_record_usd', 'estimated_total_cost_usd',
+    'detection_delay_days', 'response_time_days', 'notification_required'
+]
+CATEGORY_COLUMNS = ['system_name', 'region', 'attack_type']
+
+CREATE_TABLE_SQL = """
+CREATE TABLE breach_incidents (
+    system_name TEXT,
+    region TEXT,
+    attack_type TEXT,
+    data_sensitivity_level INTEGER,
+    records_exposed INTEGER,
+    estimated_cost_per_record_usd REAL,
+    estimated_total_cost_usd REAL,
+    detection_delay_days INTEGER,
+    response_time_days INTEGER,
+    notification_required INTEGER
+)
+"""
+
+# Written in the same transaction as the incidents; records which CSV they came from
+CREATE_METADATA_SQL = """
+CREATE TABLE load_metadata (
+    csv_md5 TEXT
+)
+"""
+
+# Integer columns downcast on read; all values fit comfortably. Sums of
+# records_exposed can outgrow int32, so the aggregations widen them to int64
+COMPACT_DTYPES = {
+    'notification_required': 'int8',
+    'data_sensitivity_level': 'int8',
+    'records_exposed': 'int32',
+    'detection_delay_days': 'int16',
+    'response_time_days': 'int16',
+}
+
+
+def _csv_md5():
+    """MD5 of the breach CSV."""
+    return hashlib.md5(CSV_PATH.read_bytes()).hexdigest()
+
+
+def _loaded_csv_md5():
+    """MD5 of the CSV the database was built from, or None if it needs a rebuild.
+
+    A missing, empty, half-written or corrupt database all count as needing
+    one.
+    """
+    if not DB_PATH.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT csv_md5 FROM load_metadata").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return None
+    return row[0] if row else None
 
-def load_csv_to_db():
-    """Load the breach CSV data into SQLite database."""
-    # Read only the main data columns (first 10 columns)
-    df = pd.read_csv(CSV_PATH, usecols=range(10))
 
-    # Clean column names
-    df.columns = [
-        'system_name', 'region', 'attack_type', 'data_sensitivity_level',
-        'records_exposed', 'estimated_cost_per_record_usd', 'estimated_total_cost_usd',
-        'detection_delay_days', 'response_time_days', 'notification_required'
-    ]
+def load_csv_to_db():
+    """Load the breach CSV data into SQLite database.
+
+    Skips the rebuild when the database was built from the current CSV
+    and returns the stored incidents instead.
+    """
+    csv_md5 = _csv_md5()
+    if _loaded_csv_md5() == csv_md5:
+        df = get_all_incidents()
+        print(f"Database at {DB_PATH} is up to date ({len(df)} records)")
+        return df
+
+    # Read only the main data columns with the pyarrow parser; the summary
+    # tables to the right of them in the sheet are skipped
+    df = pd.read_csv(
+        CSV_PATH,
+        usecols=INCIDENT_COLUMNS,
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        dtype={col: 'category' for col in CATEGORY_COLUMNS}
+    )
 
     # Convert notification_required to boolean
-    df['notification_required'] = df['notification_required'].map({'Yes': 1, 'No': 0})
+    df['notification_required'] = df['notification_required'].eq('Yes').astype('int8')
+
+    # Build into a scratch file that replaces the database only once complete,
+    # so the unjournaled, unsynced writes below can never leave it half-written
+    tmp_path = DB_PATH.with_name(DB_PATH.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
 
-    # Connect to SQLite and create table
-    conn = sqlite3.connect(DB_PATH)
+    conn.execute("BEGIN")
+    conn.execute(CREATE_TABLE_SQL)
 
-    # Write dataframe to SQLite
-    df.to_sql('breach_incidents', conn, if_exists='replace', index=False)
+    # Bulk insert the rows in a single executemany call
+    placeholders = ", ".join("?" * len(df.columns))
+    conn.executemany(f"INSERT INTO breach_incidents VALUES ({placeholders})",
+                     df.itertuples(index=False, name=None))
 
     # Create indexes for faster queries
-    cursor = conn.cursor()
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_system ON breach_incidents(system_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_region ON breach_incidents(region)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_attack ON breach_incidents(attack_type)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_system ON breach_incidents(system_name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_region ON breach_incidents(region)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_attack ON breach_incidents(attack_type)")
+
+    conn.execute(CREATE_METADATA_SQL)
+    conn.execute("INSERT INTO load_metadata VALUES (?)", (csv_md5,))
 
-    conn.commit()
+    conn.execute("COMMIT")
     conn.close()
+    os.replace(tmp_path, DB_PATH)
+    # Any open shared connection still points at the replaced file
+    reset_shared_connection()
 
     print(f"Loaded {len(df)} records into database at {DB_PATH}")
     return df
@@ -49,17 +145,68 @@ def get_connection():
     return sqlite3.connect(DB_PATH)
 
 
+@lru_cache(maxsize=1)
+def _shared_connection():
+    """Read-only connection shared by query() and query_tuples().
+
+    Opened on first use and closed at interpreter exit. Being read-only it
+    leaves the journal mode alone, so no WAL files appear next to the DB.
+    """
+    conn = sqlite3.connect(f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True,
+                           check_same_thread=False)
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    atexit.register(conn.close)
+    return conn
+
+
+def reset_shared_connection():
+    """Forget the shared connection so the next query opens a new one.
+
+    Worker processes call this so they never use a connection inherited
+    from their parent through fork.
+    """
+    _shared_connection.cache_clear()
+
+
 def query(sql, params=None):
-    """Execute a query and return results as DataFrame."""
-    conn = get_connection()
-    df = pd.read_sql_query(sql, conn, params=params)
-    conn.close()
+    """Execute a query and return results as a DataFrame.
+
+    Rows are fetched straight off the cursor; the system, region and attack
+    type columns come back as categoricals when present.
+    """
+    cursor = _shared_connection().execute(sql, params or ())
+    df = pd.DataFrame.from_records(cursor.fetchall(), columns=[col[0] for col in cursor.description])
+    for col in CATEGORY_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype('category')
     return df
 
 
-def get_all_incidents():
-    """Get all breach incidents."""
-    return query("SELECT * FROM breach_incidents")
+def query_tuples(sql, params=None):
+    """Execute a query and return results as a list of namedtuples.
+
+    Lighter than query() for small aggregate results that are only printed.
+    """
+    cursor = _shared_connection().execute(sql, params or ())
+    Row = namedtuple('Row', [col[0] for col in cursor.description])
+    return [Row(*values) for values in cursor.fetchall()]
+
+
+def get_all_incidents(columns=None):
+    """Get all breach incidents, optionally only the given columns.
+
+    The table is read once and reused until the database file changes.
+    Callers get their own copy, so adding columns never touches the cache.
+    """
+    version = DB_PATH.stat().st_mtime_ns
+    if _incidents_cache.get('version') != version:
+        _incidents_cache['df'] = query("SELECT * FROM breach_incidents").astype(COMPACT_DTYPES)
+        _incidents_cache['version'] = version
+    if columns is not None:
+        return _incidents_cache['df'][list(columns)]
+    return _incidents_cache['df'].copy()
 
 
 if __name__ == "__main__":
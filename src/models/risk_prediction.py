@@ -5,12 +5,12 @@ ML Models for breach risk prediction and pattern detection.
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
-from sklearn.linear_model import LinearRegression
 from sklearn.cluster import KMeans
 from sklearn.metrics import mean_squared_error, r2_score, classification_report, silhouette_score
 import joblib
+import pickle
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
@@ -19,49 +19,78 @@ from data.database import get_all_incidents
 MODEL_DIR = Path(__file__).parent / "saved_models"
 MODEL_DIR.mkdir(exist_ok=True)
 
+# Above this many incidents the silhouette score is estimated on a random sample
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+# Numeric incident columns shared by the models (see numeric_matrix).
+# float32 keeps every day count and record count exact; targets stay float64.
+NUMERIC_COLUMNS = [
+    'data_sensitivity_level', 'records_exposed',
+    'estimated_total_cost_usd', 'detection_delay_days', 'response_time_days'
+]
+NUMERIC_INDEX = {col: i for i, col in enumerate(NUMERIC_COLUMNS)}
+
+# Regressors of DetectionImpactModel, in coefficient order
+IMPACT_FEATURES = ['detection_delay_days', 'response_time_days', 'records_exposed']
+
+
+def numeric_matrix(df):
+    """Extract NUMERIC_COLUMNS once as a contiguous matrix the models can share."""
+    return np.ascontiguousarray(df[NUMERIC_COLUMNS].to_numpy(dtype=np.float32))
+
+
+def numeric_columns(X_num, cols):
+    """Select the named columns from a numeric_matrix() result."""
+    return X_num[:, [NUMERIC_INDEX[col] for col in cols]]
+
 
 class BreachCostPredictor:
     """Predict breach cost based on incident characteristics."""
 
     def __init__(self):
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.scaler = StandardScaler()
-        self.label_encoders = {}
-
-    def prepare_features(self, df):
-        """Prepare features for modeling."""
-        df = df.copy()
-
-        # Encode categorical variables
+        # Trees are built in parallel; random_state still seeds each tree,
+        # so results do not depend on the number of workers
+        self.model = RandomForestRegressor(n_estimators=100, n_jobs=-1, random_state=42)
+        self.label_encoders = {}  # column -> categories seen in training
+
+    def prepare_features(self, df, X_num=None):
+        """Prepare the feature matrix for modeling.
+
+        Columns are the encoded system, region and attack type followed by
+        sensitivity, records, detection delay and response time. X_num is
+        an optional numeric_matrix(df) to take the numeric columns from.
+        """
+        # Encode categorical variables as category codes (sorted, like LabelEncoder)
+        encoded = []
         for col in ['system_name', 'region', 'attack_type']:
             if col not in self.label_encoders:
-                self.label_encoders[col] = LabelEncoder()
-                df[f'{col}_encoded'] = self.label_encoders[col].fit_transform(df[col])
-            else:
-                df[f'{col}_encoded'] = self.label_encoders[col].transform(df[col])
-
-        feature_cols = [
-            'system_name_encoded', 'region_encoded', 'attack_type_encoded',
+                self.label_encoders[col] = df[col].astype('category').cat.categories
+            codes = pd.Categorical(df[col], categories=self.label_encoders[col]).codes
+            if (codes < 0).any():
+                raise ValueError(f"{col} contains labels not seen during training")
+            encoded.append(codes)
+
+        if X_num is None:
+            X_num = numeric_matrix(df)
+        numeric = numeric_columns(X_num, [
             'data_sensitivity_level', 'records_exposed',
             'detection_delay_days', 'response_time_days'
-        ]
+        ])
 
-        return df[feature_cols]
+        return np.column_stack([*encoded, numeric])
 
-    def train(self, df):
+    def train(self, df, X_num=None):
         """Train the cost prediction model."""
-        X = self.prepare_features(df)
-        y = df['estimated_total_cost_usd']
+        X = self.prepare_features(df, X_num)
+        y = df['estimated_total_cost_usd'].to_numpy()
 
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
-
-        self.model.fit(X_train_scaled, y_train)
+        # Trees split on thresholds, so the features need no scaling
+        self.model.fit(X_train, y_train)
 
         # Evaluate
-        y_pred = self.model.predict(X_test_scaled)
+        y_pred = self.model.predict(X_test)
         mse = mean_squared_error(y_test, y_pred)
         r2 = r2_score(y_test, y_pred)
 
@@ -88,43 +117,42 @@ class BreachCostPredictor:
         """Save the model."""
         joblib.dump({
             'model': self.model,
-            'scaler': self.scaler,
             'encoders': self.label_encoders
-        }, MODEL_DIR / 'cost_predictor.joblib')
+        }, MODEL_DIR / 'cost_predictor.joblib', compress=3, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 class RiskClusterAnalyzer:
     """Cluster incidents to identify risk patterns."""
 
     def __init__(self, n_clusters=4):
-        self.model = KMeans(n_clusters=n_clusters, random_state=42)
+        # A single k-means++ start with Elkan's triangle-inequality updates
+        self.model = KMeans(n_clusters=n_clusters, n_init=1, algorithm='elkan', random_state=42)
         self.scaler = StandardScaler()
 
-    def analyze(self, df):
+    def analyze(self, df, X_num=None):
         """Perform cluster analysis on incidents."""
-        features = [
-            'data_sensitivity_level', 'records_exposed',
-            'estimated_total_cost_usd', 'detection_delay_days', 'response_time_days'
-        ]
-
-        X = df[features].copy()
+        # Clusters use every shared numeric column, in NUMERIC_COLUMNS order
+        X = numeric_matrix(df) if X_num is None else X_num
         X_scaled = self.scaler.fit_transform(X)
 
         # Fit clusters
         clusters = self.model.fit_predict(X_scaled)
         df = df.copy()
-        df['cluster'] = clusters
+        df['cluster'] = clusters.astype(np.int8)
 
-        # Analyze each cluster
-        cluster_profiles = df.groupby('cluster').agg({
+        # Analyze each cluster; group unsorted and order the few profile rows after
+        cluster_profiles = df.groupby('cluster', sort=False).agg({
             'estimated_total_cost_usd': ['mean', 'count'],
             'records_exposed': 'mean',
             'data_sensitivity_level': 'mean',
             'detection_delay_days': 'mean',
             'response_time_days': 'mean'
-        }).round(2)
+        }).sort_index().round(2)
 
-        silhouette = silhouette_score(X_scaled, clusters)
+        # Exact below SILHOUETTE_SAMPLE_SIZE rows; a sampled estimate above,
+        # which keeps this step from growing quadratically with the data
+        sample_size = SILHOUETTE_SAMPLE_SIZE if len(X_scaled) > SILHOUETTE_SAMPLE_SIZE else None
+        silhouette = silhouette_score(X_scaled, clusters, sample_size=sample_size, random_state=42)
 
         return {
             'cluster_profiles': cluster_profiles,
@@ -137,39 +165,46 @@ class DetectionImpactModel:
     """Model the relationship between detection time and cost."""
 
     def __init__(self):
-        self.model = LinearRegression()
+        # Ordinary least squares fit, solved directly with numpy
+        self.coef_ = None
+        self.intercept_ = None
 
-    def fit(self, df):
+    def fit(self, df, X_num=None):
         """Fit the model to estimate detection impact."""
-        X = df[['detection_delay_days', 'response_time_days', 'records_exposed']].values
-        y = df['estimated_total_cost_usd'].values
+        if X_num is None:
+            X_num = numeric_matrix(df)
+        # The least-squares solve stays in float64; in float32 the per-day
+        # coefficients drift by tens of cents
+        X = numeric_columns(X_num, IMPACT_FEATURES).astype(np.float64)
+        y = df['estimated_total_cost_usd'].to_numpy()
 
-        self.model.fit(X, y)
+        # Intercept column appended so the solve fits it with the coefficients
+        solution, *_ = np.linalg.lstsq(np.column_stack([X, np.ones(len(X))]), y, rcond=None)
+        self.coef_, self.intercept_ = solution[:-1], solution[-1]
 
-        coef = self.model.coef_
+        coef = self.coef_
 
         return {
             'detection_day_impact': coef[0],
             'response_day_impact': coef[1],
             'record_impact': coef[2],
-            'intercept': self.model.intercept_
+            'intercept': self.intercept_
         }
 
-    def estimate_savings(self, df, detection_improvement=1, response_improvement=1):
+    def predict(self, X):
+        """Predict incident costs for rows of IMPACT_FEATURES."""
+        return X @ self.coef_ + self.intercept_
+
+    def estimate_savings(self, df, detection_improvement=1, response_improvement=1, X_num=None):
         """Estimate cost savings from faster detection/response."""
         current_cost = df['estimated_total_cost_usd'].sum()
 
-        # Create improved scenario
-        improved_df = df.copy()
-        improved_df['detection_delay_days'] = np.maximum(
-            0, improved_df['detection_delay_days'] - detection_improvement
-        )
-        improved_df['response_time_days'] = np.maximum(
-            0, improved_df['response_time_days'] - response_improvement
-        )
-
-        X_improved = improved_df[['detection_delay_days', 'response_time_days', 'records_exposed']].values
-        improved_costs = self.model.predict(X_improved)
+        # Create improved scenario on the feature matrix; records stay as they are
+        if X_num is None:
+            X_num = numeric_matrix(df)
+        X_improved = numeric_columns(X_num, IMPACT_FEATURES).astype(np.float64)
+        X_improved[:, :2] = np.maximum(0, X_improved[:, :2] - [detection_improvement, response_improvement])
+        improved_costs = self.predict(X_improved)
         improved_total = np.maximum(0, improved_costs).sum()
 
         savings = current_cost - improved_total
@@ -189,12 +224,13 @@ def run_all_models():
     print("=" * 60)
 
     df = get_all_incidents()
+    X_num = numeric_matrix(df)  # shared by all three models
 
     # 1. Cost Prediction Model
     print("\n1. COST PREDICTION MODEL (Random Forest)")
     print("-" * 60)
     cost_predictor = BreachCostPredictor()
-    cost_predictor.train(df)
+    cost_predictor.train(df, X_num)
 
     print("\nFeature Importance:")
     importance = cost_predictor.get_feature_importance()
@@ -207,7 +243,7 @@ def run_all_models():
     print("\n2. RISK CLUSTER ANALYSIS (K-Means)")
     print("-" * 60)
     cluster_analyzer = RiskClusterAnalyzer(n_clusters=4)
-    cluster_results = cluster_analyzer.analyze(df)
+    cluster_results = cluster_analyzer.analyze(df, X_num)
 
     print(f"Silhouette Score: {cluster_results['silhouette_score']:.3f}")
     print("\nCluster Profiles:")
@@ -217,14 +253,15 @@ def run_all_models():
     print("\n3. DETECTION TIME IMPACT MODEL (Linear Regression)")
     print("-" * 60)
     impact_model = DetectionImpactModel()
-    impacts = impact_model.fit(df)
+    impacts = impact_model.fit(df, X_num)
 
     print(f"Cost per detection day: ${impacts['detection_day_impact']:,.2f}")
     print(f"Cost per response day: ${impacts['response_day_impact']:,.2f}")
     print(f"Cost per record exposed: ${impacts['record_impact']:.2f}")
 
     # Estimate savings
-    savings = impact_model.estimate_savings(df, detection_improvement=2, response_improvement=1)
+    savings = impact_model.estimate_savings(df, detection_improvement=2, response_improvement=1,
+                                            X_num=X_num)
     print(f"\nEstimated savings (2-day faster detection, 1-day faster response):")
     print(f"  Current cost: ${savings['current_total_cost']:,.2f}")
     print(f"  Improved cost: ${savings['improved_total_cost']:,.2f}")
@@ -4,92 +4,152 @@ MissaTech Leadership Presentation Generator
 Creates executive slides with budget-prioritized recommendations
 """
 
+import hashlib
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import reportlab
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER, landscape
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
+from reportlab.platypus import (BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table,
+                                TableStyle, PageBreak, Image)
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
-def create_presentation(output_path=None):
-    """Generate leadership presentation PDF."""
-
-    if output_path is None:
-        output_path = Path(__file__).parent / "MissaTech_Executive_Presentation.pdf"
-
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=landscape(LETTER),
-        rightMargin=0.5*inch,
-        leftMargin=0.5*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
-    )
-
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        alignment=TA_CENTER,
-        spaceAfter=20,
-        textColor=colors.HexColor('#1a365d')
-    )
-
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=18,
-        alignment=TA_CENTER,
-        spaceAfter=30,
-        textColor=colors.HexColor('#2c5282')
-    )
-
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=20,
-        spaceAfter=15,
-        textColor=colors.HexColor('#1a365d')
-    )
-
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=12,
-        spaceAfter=8,
-        leading=16
-    )
-
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=11,
-        leftIndent=20,
-        spaceAfter=6,
-        leading=14
-    )
-
-    elements = []
-
-    # SLIDE 1: Title Slide
-    elements.append(Spacer(1, 2*inch))
-    elements.append(Paragraph("MISSATECH DATA BREACH", title_style))
-    elements.append(Paragraph("Impact Analysis & Strategic Recommendations", subtitle_style))
-    elements.append(Spacer(1, 1*inch))
-    elements.append(Paragraph("Executive Leadership Briefing", body_style))
-    elements.append(Paragraph("Business Intelligence & Cybersecurity Audit", body_style))
-    elements.append(PageBreak())
-
-    # SLIDE 2: Executive Summary
-    elements.append(Paragraph("Executive Summary: Critical Findings", heading_style))
-    elements.append(Spacer(1, 0.3*inch))
+STYLES = getSampleStyleSheet()
+
+# Custom styles, built once per process
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=STYLES['Heading1'],
+    fontSize=28,
+    alignment=TA_CENTER,
+    spaceAfter=20,
+    textColor=colors.HexColor('#1a365d')
+)
+
+SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=STYLES['Heading2'],
+    fontSize=18,
+    alignment=TA_CENTER,
+    spaceAfter=30,
+    textColor=colors.HexColor('#2c5282')
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=STYLES['Heading2'],
+    fontSize=20,
+    spaceAfter=15,
+    textColor=colors.HexColor('#1a365d')
+)
+
+BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=STYLES['Normal'],
+    fontSize=12,
+    spaceAfter=8,
+    leading=16
+)
+
+BULLET_STYLE = ParagraphStyle(
+    'CustomBullet',
+    parent=STYLES['Normal'],
+    fontSize=11,
+    leftIndent=20,
+    spaceAfter=6,
+    leading=14
+)
+
+# Table styles for each slide
+SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
+])
+
+SYSTEM_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
+])
+
+ATTACK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c53030')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fff5f5')]),
+])
+
+BUDGET_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#276749')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fff4')]),
+    ('BACKGROUND', (0, 1), (-1, 3), colors.HexColor('#c6f6d5')),
+])
+
+ROI_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 14),
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 3), (0, 3), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 5), (0, 6), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 8), (-1, 8), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 8), (-1, 8), 18),
+    ('TEXTCOLOR', (0, 8), (-1, 8), colors.HexColor('#276749')),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1a365d')),
+    ('LINEBELOW', (0, 6), (-1, 6), 2, colors.HexColor('#276749')),
+])
+
+KPI_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#553c9a')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#faf5ff')]),
+])
+
+
+def _title_slide():
+    """Slide 1: Title Slide"""
+    yield Spacer(1, 2*inch)
+    yield Paragraph("MISSATECH DATA BREACH", TITLE_STYLE)
+    yield Paragraph("Impact Analysis & Strategic Recommendations", SUBTITLE_STYLE)
+    yield Spacer(1, 1*inch)
+    yield Paragraph("Executive Leadership Briefing", BODY_STYLE)
+    yield Paragraph("Business Intelligence & Cybersecurity Audit", BODY_STYLE)
+
+
+def _summary_slide():
+    """Slide 2: Executive Summary"""
+    yield Paragraph("Executive Summary: Critical Findings", HEADING_STYLE)
+    yield Spacer(1, 0.3*inch)
 
     summary_data = [
         ['Metric', 'Value', 'Impact'],
@@ -101,26 +161,14 @@ def create_presentation(output_path=None):
     ]
 
     summary_table = Table(summary_data, colWidths=[3*inch, 2.5*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-    ]))
-    elements.append(summary_table)
-    elements.append(PageBreak())
-
-    # SLIDE 3: Cost Breakdown
-    elements.append(Paragraph("Financial Impact by System", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
+    summary_table.setStyle(SUMMARY_TABLE_STYLE)
+    yield summary_table
+
+
+def _system_cost_slide():
+    """Slide 3: Cost Breakdown"""
+    yield Paragraph("Financial Impact by System", HEADING_STYLE)
+    yield Spacer(1, 0.2*inch)
 
     system_data = [
         ['System', 'Total Cost', 'Avg/Incident', 'Priority'],
@@ -132,24 +180,17 @@ def create_presentation(output_path=None):
     ]
 
     system_table = Table(system_data, colWidths=[2*inch, 2*inch, 2*inch, 2*inch])
-    system_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-    ]))
-    elements.append(system_table)
-
-    elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("<b>Key Insight:</b> Billing and HR systems account for 66% of total losses", body_style))
-    elements.append(PageBreak())
-
-    # SLIDE 4: Root Cause Analysis
-    elements.append(Paragraph("Root Cause: Attack Vector Analysis", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
+    system_table.setStyle(SYSTEM_TABLE_STYLE)
+    yield system_table
+
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph("<b>Key Insight:</b> Billing and HR systems account for 66% of total losses", BODY_STYLE)
+
+
+def _root_cause_slide():
+    """Slide 4: Root Cause Analysis"""
+    yield Paragraph("Root Cause: Attack Vector Analysis", HEADING_STYLE)
+    yield Spacer(1, 0.2*inch)
 
     attack_data = [
         ['Attack Type', 'Incidents', 'Total Cost', '% of Losses'],
@@ -159,25 +200,19 @@ def create_presentation(output_path=None):
     ]
 
     attack_table = Table(attack_data, colWidths=[2.5*inch, 1.5*inch, 2*inch, 1.5*inch])
-    attack_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c53030')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fff5f5')]),
-    ]))
-    elements.append(attack_table)
-
-    elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("<b>Critical Finding:</b> 72% of losses stem from PREVENTABLE misconfigurations", body_style))
-    elements.append(Paragraph("• Infrastructure-as-Code could prevent majority of incidents", bullet_style))
-    elements.append(Paragraph("• Current configuration management is inadequate", bullet_style))
-    elements.append(PageBreak())
-
-    # SLIDE 5: Budget-Prioritized Recommendations
-    elements.append(Paragraph("Budget-Prioritized Action Plan", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
+    attack_table.setStyle(ATTACK_TABLE_STYLE)
+    yield attack_table
+
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph("<b>Critical Finding:</b> 72% of losses stem from PREVENTABLE misconfigurations", BODY_STYLE)
+    yield Paragraph("• Infrastructure-as-Code could prevent majority of incidents", BULLET_STYLE)
+    yield Paragraph("• Current configuration management is inadequate", BULLET_STYLE)
+
+
+def _budget_slide():
+    """Slide 5: Budget-Prioritized Recommendations"""
+    yield Paragraph("Budget-Prioritized Action Plan", HEADING_STYLE)
+    yield Spacer(1, 0.2*inch)
 
     budget_data = [
         ['Priority', 'Initiative', 'Investment', 'Expected ROI', 'Timeline'],
@@ -190,22 +225,14 @@ def create_presentation(output_path=None):
     ]
 
     budget_table = Table(budget_data, colWidths=[0.8*inch, 2.8*inch, 1.5*inch, 1.5*inch, 1.2*inch])
-    budget_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#276749')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fff4')]),
-        ('BACKGROUND', (0, 1), (-1, 3), colors.HexColor('#c6f6d5')),
-    ]))
-    elements.append(budget_table)
-    elements.append(PageBreak())
-
-    # SLIDE 6: ROI Analysis
-    elements.append(Paragraph("Investment ROI Analysis", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
+    budget_table.setStyle(BUDGET_TABLE_STYLE)
+    yield budget_table
+
+
+def _roi_slide():
+    """Slide 6: ROI Analysis"""
+    yield Paragraph("Investment ROI Analysis", HEADING_STYLE)
+    yield Spacer(1, 0.2*inch)
 
     roi_data = [
         ['Category', 'Amount'],
@@ -220,46 +247,35 @@ def create_presentation(output_path=None):
     ]
 
     roi_table = Table(roi_data, colWidths=[4*inch, 3*inch])
-    roi_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 14),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 3), (0, 3), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 5), (0, 6), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 8), (-1, 8), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 8), (-1, 8), 18),
-        ('TEXTCOLOR', (0, 8), (-1, 8), colors.HexColor('#276749')),
-        ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1a365d')),
-        ('LINEBELOW', (0, 6), (-1, 6), 2, colors.HexColor('#276749')),
-    ]))
-    elements.append(roi_table)
-    elements.append(PageBreak())
-
-    # SLIDE 7: Quick Wins
-    elements.append(Paragraph("Immediate Quick Wins (Week 1)", heading_style))
-    elements.append(Spacer(1, 0.3*inch))
-
-    elements.append(Paragraph("<b>1. Enable Cloud Security Posture Management (CSPM)</b>", body_style))
-    elements.append(Paragraph("• AWS Config / Azure Policy / GCP Security Command Center", bullet_style))
-    elements.append(Paragraph("• Cost: $0 (included in cloud services)", bullet_style))
-    elements.append(Paragraph("• Impact: Immediate visibility into misconfigurations", bullet_style))
-    elements.append(Spacer(1, 0.2*inch))
-
-    elements.append(Paragraph("<b>2. Enforce MFA on Billing & HR Systems</b>", body_style))
-    elements.append(Paragraph("• Cost: Minimal (existing identity provider)", bullet_style))
-    elements.append(Paragraph("• Impact: Reduces insider threat risk by 80%", bullet_style))
-    elements.append(Spacer(1, 0.2*inch))
-
-    elements.append(Paragraph("<b>3. Enable Database Audit Logging</b>", body_style))
-    elements.append(Paragraph("• Cost: Storage costs only", bullet_style))
-    elements.append(Paragraph("• Impact: Reduces detection time from 12 to <5 days", bullet_style))
-    elements.append(PageBreak())
-
-    # SLIDE 8: KPIs
-    elements.append(Paragraph("Success Metrics & KPIs", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
+    roi_table.setStyle(ROI_TABLE_STYLE)
+    yield roi_table
+
+
+def _quick_wins_slide():
+    """Slide 7: Quick Wins"""
+    yield Paragraph("Immediate Quick Wins (Week 1)", HEADING_STYLE)
+    yield Spacer(1, 0.3*inch)
+
+    yield Paragraph("<b>1. Enable Cloud Security Posture Management (CSPM)</b>", BODY_STYLE)
+    yield Paragraph("• AWS Config / Azure Policy / GCP Security Command Center", BULLET_STYLE)
+    yield Paragraph("• Cost: $0 (included in cloud services)", BULLET_STYLE)
+    yield Paragraph("• Impact: Immediate visibility into misconfigurations", BULLET_STYLE)
+    yield Spacer(1, 0.2*inch)
+
+    yield Paragraph("<b>2. Enforce MFA on Billing & HR Systems</b>", BODY_STYLE)
+    yield Paragraph("• Cost: Minimal (existing identity provider)", BULLET_STYLE)
+    yield Paragraph("• Impact: Reduces insider threat risk by 80%", BULLET_STYLE)
+    yield Spacer(1, 0.2*inch)
+
+    yield Paragraph("<b>3. Enable Database Audit Logging</b>", BODY_STYLE)
+    yield Paragraph("• Cost: Storage costs only", BULLET_STYLE)
+    yield Paragraph("• Impact: Reduces detection time from 12 to <5 days", BULLET_STYLE)
+
+
+def _kpi_slide():
+    """Slide 8: KPIs"""
+    yield Paragraph("Success Metrics & KPIs", HEADING_STYLE)
+    yield Spacer(1, 0.2*inch)
 
     kpi_data = [
         ['Metric', 'Current', 'Target (90 days)', 'Target (1 year)'],
@@ -271,38 +287,91 @@ def create_presentation(output_path=None):
     ]
 
     kpi_table = Table(kpi_data, colWidths=[2.5*inch, 1.5*inch, 1.8*inch, 1.8*inch])
-    kpi_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#553c9a')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#faf5ff')]),
-    ]))
-    elements.append(kpi_table)
-    elements.append(PageBreak())
-
-    # SLIDE 9: Call to Action
-    elements.append(Spacer(1, 1*inch))
-    elements.append(Paragraph("Recommended Next Steps", title_style))
-    elements.append(Spacer(1, 0.5*inch))
-
-    elements.append(Paragraph("1. <b>APPROVE</b> immediate security investment of $8-12M", body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph("2. <b>AUTHORIZE</b> emergency Billing system security audit", body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph("3. <b>ESTABLISH</b> Security Operations Center (SOC) capability", body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph("4. <b>IMPLEMENT</b> weekly security posture reviews", body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph("5. <b>TRACK</b> progress via monitoring dashboard", body_style))
-
-    elements.append(Spacer(1, 1*inch))
-    elements.append(Paragraph("Expected Net Benefit: $52-66M annually", subtitle_style))
+    kpi_table.setStyle(KPI_TABLE_STYLE)
+    yield kpi_table
+
+
+def _next_steps_slide():
+    """Slide 9: Call to Action"""
+    yield Spacer(1, 1*inch)
+    yield Paragraph("Recommended Next Steps", TITLE_STYLE)
+    yield Spacer(1, 0.5*inch)
+
+    yield Paragraph("1. <b>APPROVE</b> immediate security investment of $8-12M", BODY_STYLE)
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph("2. <b>AUTHORIZE</b> emergency Billing system security audit", BODY_STYLE)
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph("3. <b>ESTABLISH</b> Security Operations Center (SOC) capability", BODY_STYLE)
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph("4. <b>IMPLEMENT</b> weekly security posture reviews", BODY_STYLE)
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph("5. <b>TRACK</b> progress via monitoring dashboard", BODY_STYLE)
+
+    yield Spacer(1, 1*inch)
+    yield Paragraph("Expected Net Benefit: $52-66M annually", SUBTITLE_STYLE)
+
+
+SLIDES = (
+    _title_slide,
+    _summary_slide,
+    _system_cost_slide,
+    _root_cause_slide,
+    _budget_slide,
+    _roi_slide,
+    _quick_wins_slide,
+    _kpi_slide,
+    _next_steps_slide,
+)
+
+
+def _deck():
+    """Yield the flowables of every slide, one page per slide."""
+    for i, slide in enumerate(SLIDES):
+        if i:
+            yield PageBreak()
+        yield from slide()
+
+
+def _deck_key():
+    """Fingerprint of everything the deck is built from."""
+    digest = hashlib.md5(Path(__file__).read_bytes())
+    digest.update(reportlab.Version.encode())
+    return digest.hexdigest()
+
+
+def create_presentation(output_path=None):
+    """Generate leadership presentation PDF.
+
+    The slides are fixed content, so the build is skipped when the PDF
+    already exists and was made from this exact module and ReportLab version.
+    """
+
+    if output_path is None:
+        output_path = Path(__file__).parent / "MissaTech_Executive_Presentation.pdf"
+    output_path = Path(output_path)
+    stamp = output_path.with_name(f".{output_path.name}.md5")
+    key = _deck_key()
+    if output_path.exists() and stamp.exists() and stamp.read_text() == key:
+        print(f"Presentation is up to date: {output_path}")
+        return output_path
+
+    doc = BaseDocTemplate(
+        str(output_path),
+        pagesize=landscape(LETTER),
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.5*inch,
+        bottomMargin=0.5*inch,
+        compress=1,
+        invariant=1  # Same content gives a byte-identical PDF
+    )
+
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='slide')
+    doc.addPageTemplates([PageTemplate(id='slide', frames=[frame])])
 
     # Build PDF
-    doc.build(elements)
+    doc.build(list(_deck()))  # build() consumes a list
+    stamp.write_text(key)
     print(f"Presentation saved to: {output_path}")
     return output_path
 
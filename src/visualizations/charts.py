@@ -2,320 +2,469 @@
 Visualization module for MissaTech breach data analysis.
 """
 
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
+from matplotlib import colormaps, font_manager, rcParams, style
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from data.database import get_all_incidents, query
-from analysis.breach_analysis import cost_analysis_by_dimension, correlation_analysis
-
-# Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+from data.database import DB_PATH, get_all_incidents, query, reset_shared_connection
+import analysis.breach_analysis
+import data.database
+from analysis.breach_analysis import cost_analysis_by_dimension, correlation_matrix, pareto_curve
+
+# Set style; figure margins are fixed per chart instead of tight_layout
+style.use('seaborn-v0_8-whitegrid')
+# Pin the bundled font so text never falls through the style's fallback list
+rcParams['font.family'] = 'DejaVu Sans'
+rcParams['font.sans-serif'] = ['DejaVu Sans']
+# Title and axis label sizes shared by every chart
+rcParams.update({'axes.titlesize': 14, 'axes.titleweight': 'bold', 'axes.labelsize': 12})
 
 OUTPUT_DIR = Path(__file__).parent / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
+# Fingerprint of the inputs the current charts were drawn from (see _charts_key)
+STAMP_PATH = OUTPUT_DIR / ".charts.md5"
+
+# Screen resolution is enough for the slides; zlib level 1 keeps PNG encoding cheap,
+# and without the Software tag the files only change when the chart does
+SAVE_KW = dict(dpi=100, pil_kwargs={'compress_level': 1}, metadata={'Software': None})
+HEATMAP_SAVE_KW = dict(SAVE_KW, dpi=120)  # keep the cell annotations legible
+
+# Beyond this many cells heatmap labels no longer fit and are left out
+MAX_ANNOTATED_CELLS = 200
+
+# Green-to-red scale shared by the sensitivity and detection charts; colormaps[...]
+# hands out a fresh copy on every lookup, so it is fetched once
+RISK_CMAP = colormaps['RdYlGn_r']
+
+# Bar and wedge colours, sampled from their colormaps once per process
+SYSTEM_COLORS = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6']
+REGION_COLORS = colormaps['RdYlBu'](range(15))  # the first 15 entries of the colormap table
+SENSITIVITY_COLORS = RISK_CMAP([0.2, 0.4, 0.6, 0.8, 1.0])
+ATTACK_COLORS = ['#e74c3c', '#3498db', '#2ecc71']
+
+# Incident columns drawn by the cost vs detection scatter plot
+SCATTER_COLUMNS = ('detection_delay_days', 'estimated_total_cost_usd',
+                   'data_sensitivity_level', 'records_exposed')
 
 
-def plot_cost_by_system():
+# Each process draws every chart on one figure, cleared between charts
+_figure = None
+
+
+def _chart_figure(width, height):
+    """Return this process's chart figure, cleared and resized."""
+    global _figure
+    if _figure is None:
+        # Drawn straight onto an Agg canvas; pyplot never tracks the figure
+        _figure = Figure()
+        FigureCanvasAgg(_figure)
+    _figure.clear()
+    _figure.set_size_inches(width, height)
+    return _figure
+
+
+def _heatmap(ax, frame, fmt, cmap, xrotation=0, skip_zeros=False, **imshow_kw):
+    """Draw an annotated heatmap of a small DataFrame with imshow.
+
+    fmt is a printf-style format for the cell labels, e.g. '%.1f'. With
+    skip_zeros=True cells that are exactly zero are left blank. Matrices
+    with more than MAX_ANNOTATED_CELLS cells rely on the colorbar alone.
+    """
+    values = frame.to_numpy(dtype='float64')
+    im = ax.imshow(values, cmap=cmap, aspect='auto', **imshow_kw)
+    ax.set_xticks(range(values.shape[1]), frame.columns, rotation=xrotation)
+    ax.set_yticks(range(values.shape[0]), frame.index)
+    ax.set_xlabel(frame.columns.name or '', fontsize='medium')
+    ax.set_ylabel(frame.index.name or '', fontsize='medium')
+    ax.grid(False)
+    ax.figure.colorbar(im, ax=ax)
+    if values.size > MAX_ANNOTATED_CELLS:
+        return im
+
+    # Light text on dark cells, dark text on light ones
+    rgba = im.cmap(im.norm(values))
+    luminance = rgba[..., :3] @ [0.2126, 0.7152, 0.0722]
+    text_colors = np.where(luminance < 0.408, 'white', 'black')
+    labels = np.char.mod(fmt, values)
+    rows, cols = np.nonzero(values) if skip_zeros else np.indices(values.shape).reshape(2, -1)
+    for x, y, label, color in zip(cols, rows, labels[rows, cols], text_colors[rows, cols]):
+        ax.text(x, y, label, ha='center', va='center', color=color)
+    return im
+
+
+def plot_cost_by_system(df=None):
     """Bar chart of total cost by system."""
-    df = cost_analysis_by_dimension('system_name')
+    costs = cost_analysis_by_dimension('system_name', df)
 
-    fig, ax = plt.subplots(figsize=(10, 6))
-    bars = ax.bar(df['system_name'], df['total_cost'] / 1e6, color=['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6'])
+    fig = _chart_figure(10, 6)
+    ax = fig.subplots()
+    bars = ax.bar(costs['system_name'], costs['total_cost'] / 1e6, color=SYSTEM_COLORS)
 
-    ax.set_xlabel('System', fontsize=12)
-    ax.set_ylabel('Total Cost (Millions USD)', fontsize=12)
-    ax.set_title('Total Breach Cost by System', fontsize=14, fontweight='bold')
+    ax.set_xlabel('System')
+    ax.set_ylabel('Total Cost (Millions USD)')
+    ax.set_title('Total Breach Cost by System')
 
     # Add value labels
-    for bar, cost in zip(bars, df['total_cost']):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.3,
-                f'${cost/1e6:.1f}M', ha='center', va='bottom', fontsize=10)
+    ax.bar_label(bars, labels=[f'${cost/1e6:.1f}M' for cost in costs['total_cost']],
+                 padding=3, fontsize=10)
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'cost_by_system.png', dpi=150)
-    plt.close()
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.93, bottom=0.1)
+    fig.savefig(OUTPUT_DIR / 'cost_by_system.png', **SAVE_KW)
     print(f"Saved: cost_by_system.png")
 
 
-def plot_cost_by_region():
+def plot_cost_by_region(df=None):
     """Horizontal bar chart of cost by region."""
-    df = cost_analysis_by_dimension('region').head(15)
+    costs = cost_analysis_by_dimension('region', df).head(15)
 
-    fig, ax = plt.subplots(figsize=(12, 8))
-    bars = ax.barh(df['region'], df['total_cost'] / 1e6, color=plt.cm.RdYlBu(range(15)))
+    fig = _chart_figure(12, 8)
+    ax = fig.subplots()
+    bars = ax.barh(costs['region'], costs['total_cost'] / 1e6, color=REGION_COLORS)
 
-    ax.set_xlabel('Total Cost (Millions USD)', fontsize=12)
-    ax.set_ylabel('Region', fontsize=12)
-    ax.set_title('Total Breach Cost by Region (Top 15)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Total Cost (Millions USD)')
+    ax.set_ylabel('Region')
+    ax.set_title('Total Breach Cost by Region (Top 15)')
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'cost_by_region.png', dpi=150)
-    plt.close()
+    fig.subplots_adjust(left=0.12, right=0.98, top=0.95, bottom=0.08)
+    fig.savefig(OUTPUT_DIR / 'cost_by_region.png', **SAVE_KW)
     print(f"Saved: cost_by_region.png")
 
 
-def plot_attack_type_distribution():
+def _share_labels(names, values):
+    """Pie labels of the form 'name (12.3%)'."""
+    return np.char.add(names, np.char.mod(' (%.1f%%)', values / values.sum() * 100))
+
+
+def plot_attack_type_distribution(df=None):
     """Pie chart of attack type distribution."""
-    df = cost_analysis_by_dimension('attack_type')
+    by_attack = cost_analysis_by_dimension('attack_type', df)
+    names = by_attack['attack_type'].to_numpy(dtype=str)
+    counts = by_attack['incident_count'].to_numpy(dtype=np.float64)
+    costs = by_attack['total_cost'].to_numpy(dtype=np.float64)
 
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig = _chart_figure(14, 6)
+    axes = fig.subplots(1, 2)
 
     # By frequency
-    axes[0].pie(df['incident_count'], labels=df['attack_type'], autopct='%1.1f%%',
-                colors=['#e74c3c', '#3498db', '#2ecc71'])
-    axes[0].set_title('Incidents by Attack Type', fontweight='bold')
+    axes[0].pie(counts, labels=_share_labels(names, counts), colors=ATTACK_COLORS)
+    axes[0].set_title('Incidents by Attack Type', fontsize='large')
 
     # By cost
-    axes[1].pie(df['total_cost'], labels=df['attack_type'], autopct='%1.1f%%',
-                colors=['#e74c3c', '#3498db', '#2ecc71'])
-    axes[1].set_title('Cost by Attack Type', fontweight='bold')
+    axes[1].pie(costs, labels=_share_labels(names, costs), colors=ATTACK_COLORS)
+    axes[1].set_title('Cost by Attack Type', fontsize='large')
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'attack_type_distribution.png', dpi=150)
-    plt.close()
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.93, bottom=0.03, wspace=0.05)
+    fig.savefig(OUTPUT_DIR / 'attack_type_distribution.png', **SAVE_KW)
     print(f"Saved: attack_type_distribution.png")
 
 
 def plot_detection_response_heatmap():
-    """Heatmap of detection and response times by system."""
-    df = get_all_incidents()
-
-    pivot = df.pivot_table(
-        values=['detection_delay_days', 'response_time_days'],
-        index='system_name',
-        aggfunc='mean'
-    )
-
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.heatmap(pivot, annot=True, fmt='.1f', cmap='RdYlGn_r', ax=ax)
-    ax.set_title('Average Detection & Response Times by System (Days)', fontsize=14, fontweight='bold')
-
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'detection_response_heatmap.png', dpi=150)
-    plt.close()
+    """Heatmap of detection and response times by system, averaged in SQL."""
+    pivot = query("""
+        SELECT system_name,
+               AVG(detection_delay_days) AS detection_delay_days,
+               AVG(response_time_days) AS response_time_days
+        FROM breach_incidents
+        GROUP BY system_name
+        ORDER BY system_name
+    """).set_index('system_name')
+
+    fig = _chart_figure(10, 6)
+    ax = fig.subplots()
+    _heatmap(ax, pivot, '%.1f', RISK_CMAP)
+    ax.set_title('Average Detection & Response Times by System (Days)')
+
+    fig.subplots_adjust(left=0.11, right=0.98, top=0.93, bottom=0.06)
+    fig.savefig(OUTPUT_DIR / 'detection_response_heatmap.png', **HEATMAP_SAVE_KW)
     print(f"Saved: detection_response_heatmap.png")
 
 
-def plot_cost_vs_detection_scatter():
+def plot_cost_vs_detection_scatter(df=None):
     """Scatter plot of cost vs detection time."""
-    df = get_all_incidents()
+    if df is None:
+        df = get_all_incidents(columns=SCATTER_COLUMNS)
+    # One fresh float array, so the rows can be rescaled in place
+    detection, cost, sensitivity, records = df[list(SCATTER_COLUMNS)].to_numpy(dtype=np.float64).T
+    cost /= 1e6
+    records /= 1000
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _chart_figure(10, 6)
+    ax = fig.subplots()
 
     scatter = ax.scatter(
-        df['detection_delay_days'],
-        df['estimated_total_cost_usd'] / 1e6,
-        c=df['data_sensitivity_level'],
-        cmap='RdYlGn_r',
-        s=df['records_exposed'] / 1000,
+        detection,
+        cost,
+        c=sensitivity,
+        cmap=RISK_CMAP,
+        s=records,
         alpha=0.6
     )
 
-    ax.set_xlabel('Detection Delay (Days)', fontsize=12)
-    ax.set_ylabel('Total Cost (Millions USD)', fontsize=12)
-    ax.set_title('Cost vs Detection Time\n(Size = Records Exposed, Color = Sensitivity)',
-                 fontsize=14, fontweight='bold')
+    ax.set_xlabel('Detection Delay (Days)')
+    ax.set_ylabel('Total Cost (Millions USD)')
+    ax.set_title('Cost vs Detection Time\n(Size = Records Exposed, Color = Sensitivity)')
 
-    plt.colorbar(scatter, label='Sensitivity Level')
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'cost_vs_detection.png', dpi=150)
-    plt.close()
+    fig.colorbar(scatter, ax=ax).set_label('Sensitivity Level', fontsize='medium')
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.89, bottom=0.1)
+    fig.savefig(OUTPUT_DIR / 'cost_vs_detection.png', **SAVE_KW)
     print(f"Saved: cost_vs_detection.png")
 
 
 def plot_risk_matrix():
-    """Risk matrix showing high-risk system-region combinations."""
-    df = get_all_incidents()
-
-    # Aggregate by system and region
-    risk_df = df.groupby(['system_name', 'region']).agg({
-        'estimated_total_cost_usd': 'sum',
-        'records_exposed': 'sum'
-    }).reset_index()
-
-    # Create pivot for heatmap
-    pivot = risk_df.pivot_table(
-        values='estimated_total_cost_usd',
-        index='system_name',
-        columns='region',
-        aggfunc='sum',
-        fill_value=0
-    )
-
-    # Select top regions by total cost
-    top_regions = df.groupby('region')['estimated_total_cost_usd'].sum().nlargest(10).index
-    pivot = pivot[pivot.columns.intersection(top_regions)]
-
-    fig, ax = plt.subplots(figsize=(14, 6))
-    sns.heatmap(pivot / 1e6, annot=True, fmt='.1f', cmap='YlOrRd', ax=ax)
-    ax.set_title('Cost by System-Region (Millions USD)', fontsize=14, fontweight='bold')
-
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'risk_matrix.png', dpi=150)
-    plt.close()
+    """Risk matrix showing high-risk system-region combinations, summed in SQL."""
+    costs = query("""
+        SELECT system_name, region, SUM(estimated_total_cost_usd) AS total_cost
+        FROM breach_incidents
+        GROUP BY system_name, region
+    """)
+
+    # Scatter the sums into a dense system x region matrix via the category codes
+    systems = costs['system_name'].cat.categories
+    regions = costs['region'].cat.categories
+    matrix = np.zeros((len(systems), len(regions)))
+    np.add.at(matrix, (costs['system_name'].cat.codes, costs['region'].cat.codes),
+              costs['total_cost'].to_numpy())
+
+    # Select top regions by total cost, kept in alphabetical order
+    keep = np.sort(np.argsort(-matrix.sum(axis=0), kind='stable')[:10])
+    pivot = pd.DataFrame(matrix[:, keep], index=systems.rename('system_name'),
+                         columns=regions[keep].rename('region'))
+
+    fig = _chart_figure(14, 6)
+    ax = fig.subplots()
+    _heatmap(ax, pivot / 1e6, '%.1f', 'YlOrRd', xrotation=90, skip_zeros=True)
+    ax.set_title('Cost by System-Region (Millions USD)')
+
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.93, bottom=0.24)
+    fig.savefig(OUTPUT_DIR / 'risk_matrix.png', **HEATMAP_SAVE_KW)
     print(f"Saved: risk_matrix.png")
 
 
-def plot_sensitivity_analysis():
+def plot_sensitivity_analysis(df=None):
     """Bar chart showing cost by data sensitivity level."""
-    sql = """
-    SELECT
-        data_sensitivity_level,
-        COUNT(*) as count,
-        AVG(estimated_cost_per_record_usd) as avg_cost_per_record,
-        SUM(estimated_total_cost_usd) as total_cost
-    FROM breach_incidents
-    GROUP BY data_sensitivity_level
-    ORDER BY data_sensitivity_level
-    """
-    df = query(sql)
+    if df is None:
+        df = get_all_incidents()
+    by_level = df.groupby('data_sensitivity_level').agg(
+        avg_cost_per_record=('estimated_cost_per_record_usd', 'mean'),
+        total_cost=('estimated_total_cost_usd', 'sum')
+    )
+    levels = by_level.index.to_numpy()
+    avg_cost_per_record = by_level['avg_cost_per_record'].to_numpy()
+    total_cost = by_level['total_cost'].to_numpy() / 1e6
 
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    fig = _chart_figure(14, 5)
+    axes = fig.subplots(1, 2)
 
     # Average cost per record by sensitivity
-    bars1 = axes[0].bar(df['data_sensitivity_level'], df['avg_cost_per_record'],
-                        color=plt.cm.RdYlGn_r([0.2, 0.4, 0.6, 0.8, 1.0]))
-    axes[0].set_xlabel('Data Sensitivity Level', fontsize=12)
-    axes[0].set_ylabel('Avg Cost per Record (USD)', fontsize=12)
-    axes[0].set_title('Cost per Record by Sensitivity', fontsize=14, fontweight='bold')
+    bars1 = axes[0].bar(levels, avg_cost_per_record, color=SENSITIVITY_COLORS)
+    axes[0].set_xlabel('Data Sensitivity Level')
+    axes[0].set_ylabel('Avg Cost per Record (USD)')
+    axes[0].set_title('Cost per Record by Sensitivity')
 
     # Total cost by sensitivity
-    bars2 = axes[1].bar(df['data_sensitivity_level'], df['total_cost'] / 1e6,
-                        color=plt.cm.RdYlGn_r([0.2, 0.4, 0.6, 0.8, 1.0]))
-    axes[1].set_xlabel('Data Sensitivity Level', fontsize=12)
-    axes[1].set_ylabel('Total Cost (Millions USD)', fontsize=12)
-    axes[1].set_title('Total Cost by Sensitivity', fontsize=14, fontweight='bold')
-
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'sensitivity_analysis.png', dpi=150)
-    plt.close()
+    bars2 = axes[1].bar(levels, total_cost, color=SENSITIVITY_COLORS)
+    axes[1].set_xlabel('Data Sensitivity Level')
+    axes[1].set_ylabel('Total Cost (Millions USD)')
+    axes[1].set_title('Total Cost by Sensitivity')
+
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.92, bottom=0.12, wspace=0.15)
+    fig.savefig(OUTPUT_DIR / 'sensitivity_analysis.png', **SAVE_KW)
     print(f"Saved: sensitivity_analysis.png")
 
 
-def plot_correlation_matrix():
+def plot_correlation_matrix(df=None):
     """Correlation matrix of numeric variables."""
-    df = get_all_incidents()
+    if df is None:
+        df = get_all_incidents()
 
     numeric_cols = ['data_sensitivity_level', 'records_exposed', 'estimated_cost_per_record_usd',
                     'estimated_total_cost_usd', 'detection_delay_days', 'response_time_days']
 
-    corr_matrix = df[numeric_cols].corr()
+    corr_matrix = correlation_matrix(df, numeric_cols)
 
-    fig, ax = plt.subplots(figsize=(10, 8))
-    sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', center=0,
-                square=True, ax=ax)
-    ax.set_title('Correlation Matrix', fontsize=14, fontweight='bold')
+    fig = _chart_figure(10, 8)
+    ax = fig.subplots()
+    _heatmap(ax, corr_matrix, '%.2f', 'coolwarm', xrotation=90, vmin=-1, vmax=1)
+    ax.set_aspect('equal')
+    ax.set_title('Correlation Matrix')
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'correlation_matrix.png', dpi=150)
-    plt.close()
+    fig.subplots_adjust(left=0.24, right=0.98, top=0.95, bottom=0.31)
+    fig.savefig(OUTPUT_DIR / 'correlation_matrix.png', **HEATMAP_SAVE_KW)
     print(f"Saved: correlation_matrix.png")
 
 
-def plot_pareto_analysis():
+def plot_pareto_analysis(df=None):
     """Pareto chart showing cumulative cost concentration (80/20 rule)."""
-    df = get_all_incidents()
+    if df is None:
+        df = get_all_incidents()
 
     # Sort incidents by cost descending
-    df_sorted = df.sort_values('estimated_total_cost_usd', ascending=False).reset_index(drop=True)
-    df_sorted['cumulative_cost'] = df_sorted['estimated_total_cost_usd'].cumsum()
-    df_sorted['cumulative_pct'] = df_sorted['cumulative_cost'] / df_sorted['estimated_total_cost_usd'].sum() * 100
-    df_sorted['incident_pct'] = (df_sorted.index + 1) / len(df_sorted) * 100
+    costs = np.sort(df['estimated_total_cost_usd'].to_numpy(dtype=np.float64))[::-1]
+    cumulative_cost, idx_80 = pareto_curve(costs)
+    cumulative_pct = cumulative_cost / cumulative_cost[-1] * 100
+    positions = np.arange(len(costs))
 
-    fig, ax1 = plt.subplots(figsize=(12, 6))
+    fig = _chart_figure(12, 6)
+    ax1 = fig.subplots()
 
     # Bar chart for individual costs
-    bars = ax1.bar(range(len(df_sorted)), df_sorted['estimated_total_cost_usd'] / 1e6,
-                   color='#3498db', alpha=0.7, label='Individual Cost')
-    ax1.set_xlabel('Incidents (sorted by cost)', fontsize=12)
-    ax1.set_ylabel('Cost (Millions USD)', fontsize=12, color='#3498db')
+    bars = ax1.bar(positions, costs / 1e6, color='#3498db', alpha=0.7, label='Individual Cost')
+    ax1.set_xlabel('Incidents (sorted by cost)')
+    ax1.set_ylabel('Cost (Millions USD)', color='#3498db')
     ax1.tick_params(axis='y', labelcolor='#3498db')
 
     # Line chart for cumulative percentage
     ax2 = ax1.twinx()
-    ax2.plot(range(len(df_sorted)), df_sorted['cumulative_pct'],
+    ax2.plot(positions, cumulative_pct,
              color='#e74c3c', linewidth=2, marker='', label='Cumulative %')
     ax2.axhline(y=80, color='#2ecc71', linestyle='--', linewidth=1.5, label='80% threshold')
-    ax2.set_ylabel('Cumulative Cost (%)', fontsize=12, color='#e74c3c')
+    ax2.set_ylabel('Cumulative Cost (%)', color='#e74c3c')
     ax2.tick_params(axis='y', labelcolor='#e74c3c')
 
-    # Find where 80% of cost is reached
-    idx_80 = df_sorted[df_sorted['cumulative_pct'] >= 80].index[0]
-    pct_incidents_for_80 = (idx_80 + 1) / len(df_sorted) * 100
+    # Share of incidents needed to reach 80% of cost
+    pct_incidents_for_80 = (idx_80 + 1) / len(costs) * 100
 
     ax1.axvline(x=idx_80, color='#2ecc71', linestyle='--', linewidth=1.5)
 
     ax1.set_title(f'Pareto Analysis: {pct_incidents_for_80:.0f}% of incidents cause 80% of costs\n'
-                  f'(Top {idx_80+1} incidents = ${df_sorted["cumulative_cost"].iloc[idx_80]/1e6:.1f}M)',
-                  fontsize=14, fontweight='bold')
+                  f'(Top {idx_80+1} incidents = ${cumulative_cost[idx_80]/1e6:.1f}M)')
 
     # Remove x-axis tick labels for cleaner look
     ax1.set_xticks([0, 25, 50, 75, 99])
     ax1.set_xticklabels(['1', '25', '50', '75', '100'])
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'pareto_analysis.png', dpi=150)
-    plt.close()
+    fig.subplots_adjust(left=0.06, right=0.94, top=0.89, bottom=0.1)
+    fig.savefig(OUTPUT_DIR / 'pareto_analysis.png', **SAVE_KW)
     print(f"Saved: pareto_analysis.png")
 
 
 def plot_system_region_top10():
-    """Bar chart of top 10 highest-cost system-region combinations."""
-    df = get_all_incidents()
-
-    # Aggregate by system-region
-    agg_df = df.groupby(['system_name', 'region']).agg({
-        'estimated_total_cost_usd': 'sum',
-        'records_exposed': 'sum',
-        'detection_delay_days': 'mean'
-    }).reset_index()
+    """Bar chart of top 10 highest-cost system-region combinations, ranked in SQL."""
+    top10 = query("""
+        SELECT system_name, region, SUM(estimated_total_cost_usd) AS estimated_total_cost_usd
+        FROM breach_incidents
+        GROUP BY system_name, region
+        ORDER BY estimated_total_cost_usd DESC
+        LIMIT 10
+    """)
+    top10['combo'] = top10['system_name'].astype(str) + '\n' + top10['region'].astype(str)
+    costs = top10['estimated_total_cost_usd'].to_numpy()
 
-    # Get top 10
-    top10 = agg_df.nlargest(10, 'estimated_total_cost_usd')
-    top10['combo'] = top10['system_name'] + '\n' + top10['region']
+    fig = _chart_figure(12, 6)
+    ax = fig.subplots()
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    # Highlight the costliest combination
+    colors = np.where(costs == costs.max(), '#e74c3c', '#3498db').tolist()
 
-    colors = ['#e74c3c' if x == top10['estimated_total_cost_usd'].max() else '#3498db'
-              for x in top10['estimated_total_cost_usd']]
+    bars = ax.barh(top10['combo'], costs / 1e6, color=colors)
 
-    bars = ax.barh(top10['combo'], top10['estimated_total_cost_usd'] / 1e6, color=colors)
-
-    ax.set_xlabel('Total Cost (Millions USD)', fontsize=12)
-    ax.set_ylabel('System - Region', fontsize=12)
-    ax.set_title('Top 10 Highest-Cost System-Region Combinations', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Total Cost (Millions USD)')
+    ax.set_ylabel('System - Region')
+    ax.set_title('Top 10 Highest-Cost System-Region Combinations')
 
     # Add value labels
-    for bar, cost in zip(bars, top10['estimated_total_cost_usd']):
-        ax.text(bar.get_width() + 0.05, bar.get_y() + bar.get_height()/2,
-                f'${cost/1e6:.2f}M', ha='left', va='center', fontsize=9)
+    ax.bar_label(bars, labels=[f'${cost/1e6:.2f}M' for cost in costs],
+                 padding=3, fontsize=9)
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'top10_system_region.png', dpi=150)
-    plt.close()
+    fig.subplots_adjust(left=0.12, right=0.97, top=0.93, bottom=0.1)
+    fig.savefig(OUTPUT_DIR / 'top10_system_region.png', **SAVE_KW)
     print(f"Saved: top10_system_region.png")
 
 
-def generate_all_visualizations():
-    """Generate all visualizations."""
+# Every chart, keyed by the file it writes
+ALL_PLOTS = {
+    'cost_by_system.png': plot_cost_by_system,
+    'cost_by_region.png': plot_cost_by_region,
+    'attack_type_distribution.png': plot_attack_type_distribution,
+    'detection_response_heatmap.png': plot_detection_response_heatmap,
+    'cost_vs_detection.png': plot_cost_vs_detection_scatter,
+    'risk_matrix.png': plot_risk_matrix,
+    'sensitivity_analysis.png': plot_sensitivity_analysis,
+    'correlation_matrix.png': plot_correlation_matrix,
+    'pareto_analysis.png': plot_pareto_analysis,
+    'top10_system_region.png': plot_system_region_top10,
+}
+
+
+# Charts aggregated in SQL; they read the database, not the incidents frame
+SQL_PLOTS = {plot_detection_response_heatmap, plot_risk_matrix, plot_system_region_top10}
+
+# Incidents frame handed to each chart worker process by _init_worker
+_worker_df = None
+
+
+def _init_worker(df):
+    """Hand a chart worker process the shared incidents frame."""
+    global _worker_df
+    _worker_df = df
+    reset_shared_connection()
+    font_manager.findfont('DejaVu Sans')  # warm the font lookup cache
+
+
+def _render(plot):
+    """Draw one chart in a worker process and return what it printed."""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        if plot in SQL_PLOTS:
+            plot()
+        else:
+            plot(_worker_df)
+    return out.getvalue()
+
+
+def _charts_key():
+    """Fingerprint of everything the charts are drawn from."""
+    digest = hashlib.md5(DB_PATH.read_bytes())
+    for module in (__file__, analysis.breach_analysis.__file__, data.database.__file__):
+        digest.update(Path(module).read_bytes())
+    digest.update(matplotlib.__version__.encode())
+    return digest.hexdigest()
+
+
+def _stale_charts(key):
+    """Names of the charts that need drawing for the inputs fingerprinted by key.
+
+    Every chart is stale when the stamp from the last run does not match;
+    otherwise only the ones whose file has gone missing.
+    """
+    if not STAMP_PATH.exists() or STAMP_PATH.read_text() != key:
+        return list(ALL_PLOTS)
+    return [name for name in ALL_PLOTS if not (OUTPUT_DIR / name).exists()]
+
+
+def generate_all_visualizations(force=False):
+    """Generate all visualizations.
+
+    Charts already drawn from the current database and code are kept as
+    they are unless force=True. The rest are independent, so they are
+    rendered in parallel worker processes that all receive the same
+    incidents frame. Messages are printed in chart order.
+    """
     print("\nGenerating visualizations...")
     print("-" * 40)
 
-    plot_cost_by_system()
-    plot_cost_by_region()
-    plot_attack_type_distribution()
-    plot_detection_response_heatmap()
-    plot_cost_vs_detection_scatter()
-    plot_risk_matrix()
-    plot_sensitivity_analysis()
-    plot_correlation_matrix()
-    plot_pareto_analysis()
-    plot_system_region_top10()
-
+    key = _charts_key()
+    stale = list(ALL_PLOTS) if force else _stale_charts(key)
+    outputs = {name: f"Up to date: {name}\n" for name in ALL_PLOTS}
+    if stale:
+        df = get_all_incidents()
+        workers = min(len(stale), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(df,)) as pool:
+            outputs.update(zip(stale, pool.map(_render, [ALL_PLOTS[name] for name in stale])))
+        STAMP_PATH.write_text(key)
+
+    print(''.join(outputs.values()), end='')
     print(f"\nAll visualizations saved to: {OUTPUT_DIR}")
 
 